@@ -1,27 +1,444 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import time
+import functools
 import json
+import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import os
+import random
+import re
+import signal
+import sys
+import textwrap
 import pytz
 import threading
 import queue
+from collections import Counter, deque
+from typing import NamedTuple
 
-# Load environment variables
+try:
+    import orjson  # Optional: much faster JSON decoding for large task-pool responses
+except ImportError:
+    orjson = None
+
+# Load environment variables once, at import
 load_dotenv()
+EMAIL = os.getenv("EMAIL")
+PASSWORD = os.getenv("PASSWORD")
+NTFY_URL = os.getenv("NTFY_URL")
+
+# Only re-check cooldown with the server once fewer than this many seconds remain locally
+COOLDOWN_RESYNC_WINDOW = 300
+
+# Longest single sleep during a cooldown; the bot re-checks with the server at least this often
+MAX_COOLDOWN_SLEEP = 900
+
+# Upper bound (seconds) of the random delay added after the cooldown end before polling again
+COOLDOWN_WAKE_JITTER = 5
+
+# Safe tasks tried per check when earlier claims fail (e.g. taken by someone else first)
+MAX_CLAIM_ATTEMPTS = 3
+
+# Cooldown alerts, as (seconds before the cooldown ends, title, emoji, priority, tags)
+COOLDOWN_ALERTS = (
+    (3600, "1 Hour Left", "⏰", "high", "alarm_clock"),
+    (600, "10 Minutes Left", "⏰", "high", "alarm_clock"),
+    (120, "Cooldown Ending", "🔥", "urgent", "fire"),
+)
+
+# Task deadline warnings, as (seconds before the deadline, title, emoji, priority, tags)
+DEADLINE_WARNINGS = (
+    (7200, "2 Hours Left", "⚠️", "high", "warning"),
+    (1800, "30 Minutes Left", "🚨", "urgent", "fire"),
+)
+
+# ntfy priority names from least to most important, for choosing what to drop when the queue is full
+NOTIFICATION_PRIORITY_RANK = {'min': 1, 'low': 2, 'default': 3, 'high': 4, 'urgent': 5}
+
+# Pending notifications kept for the worker; beyond this the lowest-priority one is dropped
+NOTIFICATION_QUEUE_SIZE = 32
+
+# Identical notifications (same title and message) are sent at most once per this many seconds
+NOTIFICATION_DEDUPE_TTL = 600
+
+# Task-pool statuses that can still be claimed (published/completed/expired/cancelled can't)
+AVAILABLE_TASK_STATUSES = frozenset(('assignment-pending', 'pending', 'available', 'active'))
+
+# Task types claimed when the type field matches exactly (other spellings fall back to a regex search)
+ALLOWED_TASK_TYPES = frozenset(('RedditCommentTask', 'RedditReplyTask'))
+# ...and the case-insensitive fallback, searched across type/name/title
+ALLOWED_TASK_TYPE_RE = re.compile(r'redditcommenttask|redditreplytask', re.IGNORECASE)
+# Rejection reason for other types, built from the allowed set so the two can't drift apart
+WRONG_TYPE_REASON = f"Wrong type - only {', '.join(sorted(ALLOWED_TASK_TYPES))} allowed"
+
+# Rejected tasks whose full details are kept for the per-check printout
+MAX_REJECTION_DETAILS = 5
+
+# Seconds a fetched task summary (earnings/payout totals) is reused
+TASK_SUMMARY_TTL = 60
+
+# Threads used to issue independent API requests concurrently
+HTTP_WORKERS = 4
+
+# After this many empty task searches in a row the search interval doubles per further
+# empty search, up to MAX_CHECK_INTERVAL seconds; it drops back as soon as tasks appear
+EMPTY_CHECKS_BEFORE_BACKOFF = 3
+MAX_CHECK_INTERVAL = 30
+
+# Seconds a polled GET response is reused, so checks within one loop tick share a request
+POLL_CACHE_TTL = 2.0
+
+# (connect, read) timeout for polled GETs, so a hung server can't stall the 3-second loop
+POLL_TIMEOUT = (2, 4)
+
+# Timezones resolved once; pytz keeps the bot working on Windows without tzdata
+IST = pytz.timezone('Asia/Kolkata')
+UTC = pytz.UTC
+IST_OFFSET_SECONDS = 5 * 3600 + 30 * 60  # IST is UTC+5:30 all year
+_EPOCH_IST_NAIVE = datetime(1970, 1, 1) + timedelta(seconds=IST_OFFSET_SECONDS)
+
+logger = logging.getLogger("taskflux")
+
+# Patterns used by the content filters, compiled once at import
+URL_RE = re.compile(r'https?://[^\s]+')
+REDDIT_URL_SUBREDDIT_RE = re.compile(r'reddit\.com/r/([a-zA-Z0-9_]+)')
+SUBREDDIT_MENTION_RE = re.compile(r'\br/([a-zA-Z0-9_]+)')
+NSFW_URL_PATH_RE = re.compile(r'/(?:nsfw|adult|xxx|18\+|porn|nude|erotic)')
+REPEATED_CHAR_RE = re.compile(r'(.)\1{5}', re.DOTALL)  # The same character 6+ times in a row
+
+# Substrings that mark a subreddit name as NSFW even when it isn't in the known list
+NSFW_SUBREDDIT_KEYWORDS = (
+    'nsfw', 'gonewild', 'porn', 'xxx', 'nude', 'naked', 'sex',
+    'hentai', 'rule34', 'cumslut', 'slut', 'milf', 'gilf',
+    'boobs', 'tits', 'ass', 'pussy', 'dick', 'cock', 'penis',
+    '18+', 'adult', 'explicit', 'erotic', 'fetish', 'bdsm',
+)
+
+
+def _loads(raw):
+    """Decode JSON bytes, using orjson when it is installed (raises json.JSONDecodeError either way)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj):
+    """Encode obj as JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=64)
+def _clean_title(title):
+    """
+    Notification title safe for an HTTP header: emojis and other non-Latin-1 characters
+    removed, no surrounding whitespace. Cached - titles come from a small fixed set.
+    """
+    clean_title = title.encode('latin-1', errors='ignore').decode('latin-1').strip()
+    # If title becomes empty after removing emojis, use a default
+    return clean_title or "TaskFlux Notification"
+
+
+@functools.lru_cache(maxsize=64)
+def _ntfy_headers(title, priority, tags):
+    """
+    Per-notification ntfy headers, built once per (title, priority, tags) - there are only
+    a couple of dozen distinct kinds. Shared between sends, so callers must not mutate it
+    (requests copies headers into its own dict before sending).
+    """
+    headers = {"Priority": priority, "Title": _clean_title(title)}
+    if tags:
+        headers["Tags"] = tags
+    return headers
+
+
+def _json(response):
+    """Decode a JSON response body (see _loads)"""
+    return _loads(response.content)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_ist_naive(value):
+    """
+    Parse a server ISO timestamp (UTC, naive treated as UTC) into a naive IST datetime.
+    Cached: the same allowedAfter / assignedAt strings come back on poll after poll.
+    """
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(IST).replace(tzinfo=None)
+
+
+class TaskSummary(NamedTuple):
+    """Earnings totals from /api/tasks/task-summary"""
+    total_amount: float
+    total_payouts: float
+    remaining_payout: float
+
+
+class PoolSnapshot(NamedTuple):
+    """One /api/tasks/task-pool response, indexed in a single pass"""
+    tasks: list
+    by_assignee: dict    # assignedTo -> [tasks]; unassigned tasks are not indexed
+    available: list      # unassigned, unpublished tasks in a claimable state
+
+
+def _index_task_pool(tasks):
+    """Build a PoolSnapshot from a task-pool task list"""
+    by_assignee = {}
+    available = []
+    for task in tasks:
+        assigned_to = task.get('assignedTo')
+        if assigned_to:
+            by_assignee.setdefault(assigned_to, []).append(task)
+        elif not task.get('isPublished') and (task.get('status') or '').lower() in AVAILABLE_TASK_STATUSES:
+            available.append(task)
+    return PoolSnapshot(tasks, by_assignee, available)
+
+
+def _ist_naive_to_epoch(dt):
+    """Unix timestamp of a naive IST datetime (independent of the host's local timezone)"""
+    return (dt - _EPOCH_IST_NAIVE).total_seconds()
+
+
+def _epoch_to_ist_naive(ts):
+    """Naive IST datetime for a Unix timestamp (inverse of _ist_naive_to_epoch)"""
+    return _EPOCH_IST_NAIVE + timedelta(seconds=ts)
+
+
+def _claim_priority(task):
+    """Sort key for claim order: highest price first, then most recently created"""
+    try:
+        price = float(_first(task, 'price', 'microWorkerPrice') or 0)
+    except (TypeError, ValueError):
+        price = 0.0
+    # ISO-8601 timestamps from the API compare correctly as strings
+    return price, task.get('createdAt') or ''
+
+
+def _first(data, *keys):
+    """Return the first truthy value among data[key] for the given keys, or None"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _task_banner(heading, task_type, task_price, task_id):
+    """Opening lines shared by the terminal task banners; callers append their own rows"""
+    return [
+        f"\n{'═'*60}",
+        heading,
+        f"{'═'*60}",
+        f"📋 Type: {task_type}",
+        f"💵 Price: ${task_price}",
+        f"🆔 Task ID: {task_id}",
+    ]
+
 
 class TaskFluxBot:
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute
+    # access in the polling loop. Every attribute set on the bot must be listed here.
+    __slots__ = (
+        'base_url', 'task_pool_url', 'can_assign_url',
+        'email', 'password', 'ntfy_url', 'session', 'http_pool', 'token', 'user_id',
+        'poll_cache', 'poll_cache_locks', '_task_summary_cache', '_pool_snapshot',
+        '_cooldown_end', '_cooldown_end_ts', 'cooldown_file', '_saved_cooldown_end', 'cooldown_from_server', 'cooldown_alert_timers', '_alerts_cooldown_end',
+        'consecutive_empty_checks',
+        'task_claimed_at', 'task_deadline', 'task_deadline_mono', 'deadline_warning_timers',
+        'current_task_id', 'current_task_type',
+        'is_paused', 'command_queue', 'wake_event', 'wake_requested', 'listener_thread', 'stop_listener',
+        'notification_queue', 'notification_cond', 'notification_delivering',
+        'notification_thread', 'ntfy_session',
+        'recent_notifications', 'recent_notifications_lock',
+        'claim_start_hour', 'claim_end_hour', '_next_wake_ts',
+        '_assigned_task_notified', '_off_hours_sleep_sent',
+    )
+    
+    # Content filter data below is shared by all instances and built once at import
+    
+    # Suspicious words/patterns that might trigger AutoMod or get removed
+    # Based on common Reddit AutoMod rules and spam patterns (lowercased, matched against lowercased text)
+    suspicious_patterns = tuple(p.lower() for p in (
+        # Common spam/money-making schemes (high risk)
+        'click here', 'free money', 'make money fast', 'get rich', 'earn money',
+        'work from home', 'passive income', 'easy money', 'quick cash',
+        
+        # Promotional/commercial spam (high risk)
+        'buy now', 'limited time', 'act now', 'don\'t miss', 'special offer',
+        'discount code', 'promo code', 'coupon code', 'affiliate', 'referral link',
+        
+        # Link shorteners (commonly blocked by AutoMod)
+        'bit.ly', 'tinyurl', 'goo.gl', 'shortened link', 't.co/',
+        
+        # Direct solicitation (medium-high risk)
+        'dm me', 'pm me for', 'message me', 'text me', 'whatsapp', 'telegram',
+        'contact me at', 'email me',
+        
+        # Crypto/financial spam (commonly filtered)
+        'crypto', 'bitcoin', 'btc', 'ethereum', 'nft', 'forex', 
+        'trading signals', 'investment opportunity', 'pump and dump',
+        
+        # Self-promotion (medium risk)
+        'check out my', 'subscribe to my', 'follow me on', 'my channel',
+        'my youtube', 'my instagram', 'my tiktok', 'my website', 'my blog',
+        'visit my', 'join my',
+        
+        # Vote manipulation (high risk - Reddit rules violation)
+        'upvote if', 'upvote this', 'give me karma', 'need karma',
+        'vote manipulation', 'brigade', 'mass upvote',
+        
+        # Offensive/hateful content (high risk)
+       
+        'kill urself', 'neck yourself', 'stupid ass', 'dumb fuck',
+        
+        # Spam indicators (medium risk)
+        'check dm', 'check inbox', 'sent you a message', 'link in bio',
+        'link in profile', 'click profile', 'bot account',
+        
+        # NSFW content (high risk - commonly filtered)
+        'porn', 'xxx', 'nsfw', 'nude', 'nudes', 'naked', 'sex', 'sexy',
+        'onlyfans', 'only fans', 'premium snapchat', 'buy my nudes',
+        'adult content', 'explicit', 'pornhub', 'xvideos', 'xhamster',
+        '18+', 'nsfl', 'gore', 'hentai', 'cam girl', 'camgirl',
+        'escort', 'hooker', 'prostitute', 'call girl', 'massage parlor',
+        'happy ending', 'erotic', 'fetish', 'bdsm', 'kink',
+        'masturbat', 'orgasm', 'cumshot', 'blowjob', 'handjob',
+        'titties', 'boobs', 'pussy', 'dick', 'cock', 'penis', 'vagina',
+        'dildo', 'vibrator', 'sex toy', 'lingerie', 'underwear pics',
+    ))
+    # All patterns compiled into one alternation so content is scanned in a single pass
+    suspicious_re = re.compile('|'.join(re.escape(p) for p in suspicious_patterns))
+    
+    # NSFW domains and websites (commonly blocked)
+    nsfw_domains = (
+        'pornhub.com', 'xvideos.com', 'xhamster.com', 'redtube.com',
+        'youporn.com', 'xnxx.com', 'spankbang.com', 'porn.com',
+        'tube8.com', 'beeg.com', 'txxx.com', 'vporn.com',
+        'onlyfans.com', 'fansly.com', 'patreon.com/adult',
+        'chaturbate.com', 'myfreecams.com', 'cam4.com', 'streamate.com',
+        'livejasmin.com', 'stripchat.com', 'bongacams.com',
+        'manyvids.com', 'clips4sale.com', 'iwantclips.com',
+        'reddit.com/r/nsfw', 'reddit.com/r/gonewild', 'reddit.com/r/realgirls',
+        'imgur.com/r/nsfw', 'imgur.com/r/gonewild',
+        'erome.com', 'redgifs.com', 'gfycat.com/nsfw',
+    )
+    # Longest first, so a domain that contains another is the one reported
+    nsfw_domain_re = re.compile('|'.join(re.escape(d) for d in sorted(nsfw_domains, key=len, reverse=True)))
+    
+    # NSFW subreddits to filter out (common adult/NSFW subreddits),
+    # lowercased into a set so each lookup is a single hash probe
+    nsfw_subreddits = frozenset(s.lower() for s in (
+        # Popular NSFW subreddits
+        'nsfw', 'gonewild', 'realgirls', 'nsfw_gifs', 'nsfw_gif',
+        'nsfwfunny', 'nsfwhardcore', 'rule34', 'hentai', 'ecchi',
+        'porn', 'porninfifteenseconds', 'pornstarhq', 'pornid',
+        'holdthemoan', 'gwcouples', 'gwnerdy', 'gonemild', 
+        'petitegonewild', 'gonewildcurvy', 'gonewildplus',
+        'gonewildcolor', 'gonewildaudio', 'gonewildstories',
+        'asiansgonewild', 'indiansgonewild', 'latinas', 'latinareleased',
+        'onoff', 'undressedBabes', 'ass', 'asstastic', 'booty',
+        'bigasses', 'pawg', 'boobs', 'boobies', 'bigboobs', 'tits',
+        'bigtits', 'busty', 'bustypetite', 'hugeboobs', 'tinytits',
+        'aa_cups', 'collegesluts', 'collegensfw', 'amateur',
+        'realamateurporn', 'homemadexxx', 'couplesgonewild',
+        'hotwife', 'wifesharing', 'cuckold', 'swingers',
+        'milf', 'milfs', 'maturemilf', 'gilf',
+        'cumsluts', 'cumfetish', 'cumshots', 'facials',
+        'creampies', 'breeding', 'impregnation',
+        'bdsm', 'bondage', 'femdom', 'maledom', 'submissive',
+        'feet', 'footfetish', 'feetpics', 'buttsandbarefeet',
+        'thighs', 'thighdeology', 'legs', 'pantyhose', 'stockings',
+        'lingerie', 'lingeriegw', 'underwear', 'panties',
+        'thongs', 'bikinis', 'bikinibridge', 'sexyfrex',
+        'celebnsfw', 'celebhub', 'nsfwcelebarchive',
+        'jerkofftocelebs', 'celebritypussy', 'celebsnaked',
+        'lesbians', 'dykesgonewild', 'girlskissing',
+        'publicflashing', 'flashingandflaunting', 'exhibitionism',
+        'workgonewild', 'naughtyatwork', 'gonewildatwork',
+        'fuckmeat', 'degradingholes', 'freeuse',
+        'rapefantasies', 'cnc_connect', 'rapekink',
+        'thick', 'thickthighs', 'theratio', 'datgap',
+        'simps', 'godpussy', 'spreading', 'pelfie',
+        'facesitting', 'lipsthatgrip', 'whenitgoesin',
+        'insertions', 'distension', 'suctiondildos',
+        'orgasmiccontractions', 'quiver', 'orgasms',
+        'masturbation', 'jilling', 'grool', 'wetspot',
+        'camwhores', 'camsluts', 'streamersgonemild',
+        'tiktoksweets', 'tiktokthots', 'tiktoknsfw',
+        'cosplaybutts', 'nsfwcosplay', 'cosplaygirls',
+        'anime_nsfw', 'animeporn', 'hentaigifs',
+        'genshin_impact_nsfw', 'honkaiimpact3',
+        'fitnakedgirls', 'fitgirls', 'athleticgirls',
+        'gymgirls', 'yogapants', 'girlsinyogapants',
+        'assinyogapants', 'tightshorts', 'tightsqueeze',
+        'altgonewild', 'gothsluts', 'bigtiddygothgf',
+        'suicidegirls', 'tattooed_girls', 'hotchickswithtattoos',
+        'girlswithneonhair', 'hairypussy', 'razorfree',
+        'gonewild30plus', 'gonewild40plus', 'onmywildside',
+        'slutwife', 'wouldyoubonemywife', 'wifepictrading',
+        'nudes', 'nude', 'nudeselfies', 'snapchatsext',
+        'sextingfriendfinder', 'dirtySnapchat',
+        'onlyfanspromo', 'onlyfansadvice', 'fansly_advice',
+        'sexsells', 'usedpanties', 'pantyselling',
+        'nsfwskyrim', 'rule34lol', 'rule34overwatch',
+        'overwatchporn', 'leagueoflegends34', 'pokeporn',
+        'slutsofsnapchat', 'dirtysnapchat', 'snapchat_sluts',
+        'festivalsluts', 'trashyboners', 'trashy',
+        'wincest', 'incest', 'incestporn',
+        'gayporn', 'gaypornhunters', 'gaybrosgonewild',
+        'ladybonersgw', 'massivecock', 'penis',
+        'twinks', 'femboys', 'traps', 'sissies',
+        'transgonewild', 'transdiy', 'mtfbutts',
+        'pegging', 'strapon', 'gentlefemdom',
+        # NSFW indicators in subreddit name
+        'gonewild', 'nsfw', 'porn', 'xxx', 'nude', 'naked',
+        'sex', 'hentai', 'rule34', 'cumslut', 'slut', 'whore',
+        'milf', 'gilf', 'dilf', 'pawg', 'bwc', 'bbc',
+        '18+', 'adult', 'explicit',
+    ))
+    
     def __init__(self):
         self.base_url = "https://taskflux.net"
-        self.email = os.getenv("EMAIL")
-        self.password = os.getenv("PASSWORD")
-        self.ntfy_url = os.getenv("NTFY_URL")
+        # Polled endpoints, built once (also the poll-cache keys)
+        self.task_pool_url = f"{self.base_url}/api/tasks/task-pool"
+        self.can_assign_url = f"{self.base_url}/api/tasks/can-assign-task-to-self"
+        self.email = EMAIL
+        self.password = PASSWORD
+        self.ntfy_url = NTFY_URL
         self.session = requests.Session()
+        # Worker threads for issuing independent API requests concurrently
+        self.http_pool = ThreadPoolExecutor(max_workers=HTTP_WORKERS, thread_name_prefix="taskflux-io")
+        # Keep one persistent connection to taskflux.net per thread that can use the
+        # session (the IO workers plus the main loop) so requests never re-handshake.
+        # Brief gateway errors on polls are retried in place; the claim PUT and login
+        # POST are never retried here since their callers handle failures themselves.
+        # allowed_methods only limits status/read retries, so connection-error retries
+        # (which apply to every method) are switched off with connect=0.
+        retries = Retry(total=2, connect=0, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset(('GET',)), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=HTTP_WORKERS + 1, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+        # Short-lived cache of polled GET responses: url -> (fetched_at, status, data, etag, last_modified)
+        self.poll_cache = {}
+        self.poll_cache_locks = {}  # url -> lock, so concurrent callers share one request
+        self._task_summary_cache = None  # (fetched_at monotonic, TaskSummary) of the last successful fetch
+        self._pool_snapshot = None  # (raw task-pool data, PoolSnapshot) - rebuilt only when the data changes
         self.token = None
         self.user_id = None
-        self.cooldown_end = None
+        self.cooldown_end = None  # Naive IST; setting it also sets _cooldown_end_ts
         self.cooldown_file = "cooldown.json"
+        self._saved_cooldown_end = None  # (cooldown_end, cooldown_from_server) as last read from / written to cooldown_file
+        self.cooldown_from_server = False  # True if the server reported cooldown_end, False if we started it
+        self.cooldown_alert_timers = []  # threading.Timer per pending cooldown alert
+        self._alerts_cooldown_end = None  # cooldown_end the pending alert timers were scheduled for
         
         # Task availability tracking
         self.consecutive_empty_checks = 0
@@ -29,246 +446,365 @@ class TaskFluxBot:
         # Task deadline tracking (6-hour completion limit)
         self.task_claimed_at = None
         self.task_deadline = None
-        self.deadline_warning_sent = False
-        self.deadline_final_warning_sent = False
+        self.task_deadline_mono = None  # time.monotonic() value of task_deadline, for countdowns
+        self.deadline_warning_timers = []  # threading.Timer per pending deadline warning
         self.current_task_id = None  # Track current assigned task ID
         self.current_task_type = None  # Track current task type (RedditCommentTask or RedditReplyTask)
+        self._assigned_task_notified = False  # Whether the current assignment has been announced
         
         # Command handling (ntfy bidirectional communication)
         self.is_paused = False  # Pause state - when True, bot won't claim new tasks
         self.command_queue = queue.Queue()  # Thread-safe queue for commands
+        self.wake_event = threading.Event()  # Set when a command arrives to cut waits short
+        self.wake_requested = False  # Set by SIGUSR1: end the current wait and re-check now
         self.listener_thread = None  # Background thread for listening to ntfy
         self.stop_listener = False  # Flag to gracefully stop listener thread
         
+        # Outgoing notifications are queued and delivered by a background
+        # worker so a slow or unreachable ntfy server never stalls the poll loop
+        # (title, message, priority, tags, delay_after) items, guarded by notification_cond,
+        # which also wakes the worker and anyone flushing the queue
+        self.notification_queue = deque()
+        self.notification_cond = threading.Condition()
+        self.notification_delivering = False  # True while the worker is sending an item
+        self.notification_thread = None
+        # Separate session for posting notifications (used only by the worker thread),
+        # so the TLS connection to the ntfy host stays open between alerts
+        self.ntfy_session = requests.Session()
+        self.ntfy_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.ntfy_session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "text/plain; charset=utf-8",
+        })
+        self.recent_notifications = {}  # hash((title, message)) -> monotonic time queued
+        self.recent_notifications_lock = threading.Lock()
+        
         # Custom claiming hours (default: 8 AM - 11 PM IST)
         self.claim_start_hour = 8  # Start hour (24-hour format)
         self.claim_end_hour = 23   # End hour (24-hour format, 23 = 11 PM)
-        
-        # Suspicious words/patterns that might trigger AutoMod or get removed
-        # Based on common Reddit AutoMod rules and spam patterns
-        self.suspicious_patterns = [
-            # Common spam/money-making schemes (high risk)
-            'click here', 'free money', 'make money fast', 'get rich', 'earn money',
-            'work from home', 'passive income', 'easy money', 'quick cash',
-            
-            # Promotional/commercial spam (high risk)
-            'buy now', 'limited time', 'act now', 'don\'t miss', 'special offer',
-            'discount code', 'promo code', 'coupon code', 'affiliate', 'referral link',
-            
-            # Link shorteners (commonly blocked by AutoMod)
-            'bit.ly', 'tinyurl', 'goo.gl', 'shortened link', 't.co/',
-            
-            # Direct solicitation (medium-high risk)
-            'dm me', 'pm me for', 'message me', 'text me', 'whatsapp', 'telegram',
-            'contact me at', 'email me',
-            
-            # Crypto/financial spam (commonly filtered)
-            'crypto', 'bitcoin', 'btc', 'ethereum', 'nft', 'forex', 
-            'trading signals', 'investment opportunity', 'pump and dump',
-            
-            # Self-promotion (medium risk)
-            'check out my', 'subscribe to my', 'follow me on', 'my channel',
-            'my youtube', 'my instagram', 'my tiktok', 'my website', 'my blog',
-            'visit my', 'join my',
-            
-            # Vote manipulation (high risk - Reddit rules violation)
-            'upvote if', 'upvote this', 'give me karma', 'need karma',
-            'vote manipulation', 'brigade', 'mass upvote',
-            
-            # Offensive/hateful content (high risk)
-           
-            'kill urself', 'neck yourself', 'stupid ass', 'dumb fuck',
-            
-            # Spam indicators (medium risk)
-            'check dm', 'check inbox', 'sent you a message', 'link in bio',
-            'link in profile', 'click profile', 'bot account',
-            
-            # NSFW content (high risk - commonly filtered)
-            'porn', 'xxx', 'nsfw', 'nude', 'nudes', 'naked', 'sex', 'sexy',
-            'onlyfans', 'only fans', 'premium snapchat', 'buy my nudes',
-            'adult content', 'explicit', 'pornhub', 'xvideos', 'xhamster',
-            '18+', 'nsfl', 'gore', 'hentai', 'cam girl', 'camgirl',
-            'escort', 'hooker', 'prostitute', 'call girl', 'massage parlor',
-            'happy ending', 'erotic', 'fetish', 'bdsm', 'kink',
-            'masturbat', 'orgasm', 'cumshot', 'blowjob', 'handjob',
-            'titties', 'boobs', 'pussy', 'dick', 'cock', 'penis', 'vagina',
-            'dildo', 'vibrator', 'sex toy', 'lingerie', 'underwear pics'
-        ]
-        
-        # NSFW domains and websites (commonly blocked)
-        self.nsfw_domains = [
-            'pornhub.com', 'xvideos.com', 'xhamster.com', 'redtube.com',
-            'youporn.com', 'xnxx.com', 'spankbang.com', 'porn.com',
-            'tube8.com', 'beeg.com', 'txxx.com', 'vporn.com',
-            'onlyfans.com', 'fansly.com', 'patreon.com/adult',
-            'chaturbate.com', 'myfreecams.com', 'cam4.com', 'streamate.com',
-            'livejasmin.com', 'stripchat.com', 'bongacams.com',
-            'manyvids.com', 'clips4sale.com', 'iwantclips.com',
-            'reddit.com/r/nsfw', 'reddit.com/r/gonewild', 'reddit.com/r/realgirls',
-            'imgur.com/r/nsfw', 'imgur.com/r/gonewild',
-            'erome.com', 'redgifs.com', 'gfycat.com/nsfw'
-        ]
-        
-        # NSFW subreddits to filter out (common adult/NSFW subreddits)
-        self.nsfw_subreddits = [
-            # Popular NSFW subreddits
-            'nsfw', 'gonewild', 'realgirls', 'nsfw_gifs', 'nsfw_gif',
-            'nsfwfunny', 'nsfwhardcore', 'rule34', 'hentai', 'ecchi',
-            'porn', 'porninfifteenseconds', 'pornstarhq', 'pornid',
-            'holdthemoan', 'gwcouples', 'gwnerdy', 'gonemild', 
-            'petitegonewild', 'gonewildcurvy', 'gonewildplus',
-            'gonewildcolor', 'gonewildaudio', 'gonewildstories',
-            'asiansgonewild', 'indiansgonewild', 'latinas', 'latinareleased',
-            'onoff', 'undressedBabes', 'ass', 'asstastic', 'booty',
-            'bigasses', 'pawg', 'boobs', 'boobies', 'bigboobs', 'tits',
-            'bigtits', 'busty', 'bustypetite', 'hugeboobs', 'tinytits',
-            'aa_cups', 'collegesluts', 'collegensfw', 'amateur',
-            'realamateurporn', 'homemadexxx', 'couplesgonewild',
-            'hotwife', 'wifesharing', 'cuckold', 'swingers',
-            'milf', 'milfs', 'maturemilf', 'gilf',
-            'cumsluts', 'cumfetish', 'cumshots', 'facials',
-            'creampies', 'breeding', 'impregnation',
-            'bdsm', 'bondage', 'femdom', 'maledom', 'submissive',
-            'feet', 'footfetish', 'feetpics', 'buttsandbarefeet',
-            'thighs', 'thighdeology', 'legs', 'pantyhose', 'stockings',
-            'lingerie', 'lingeriegw', 'underwear', 'panties',
-            'thongs', 'bikinis', 'bikinibridge', 'sexyfrex',
-            'celebnsfw', 'celebhub', 'nsfwcelebarchive',
-            'jerkofftocelebs', 'celebritypussy', 'celebsnaked',
-            'lesbians', 'dykesgonewild', 'girlskissing',
-            'publicflashing', 'flashingandflaunting', 'exhibitionism',
-            'workgonewild', 'naughtyatwork', 'gonewildatwork',
-            'fuckmeat', 'degradingholes', 'freeuse',
-            'rapefantasies', 'cnc_connect', 'rapekink',
-            'thick', 'thickthighs', 'theratio', 'datgap',
-            'simps', 'godpussy', 'spreading', 'pelfie',
-            'facesitting', 'lipsthatgrip', 'whenitgoesin',
-            'insertions', 'distension', 'suctiondildos',
-            'orgasmiccontractions', 'quiver', 'orgasms',
-            'masturbation', 'jilling', 'grool', 'wetspot',
-            'camwhores', 'camsluts', 'streamersgonemild',
-            'tiktoksweets', 'tiktokthots', 'tiktoknsfw',
-            'cosplaybutts', 'nsfwcosplay', 'cosplaygirls',
-            'anime_nsfw', 'animeporn', 'hentaigifs',
-            'genshin_impact_nsfw', 'honkaiimpact3',
-            'fitnakedgirls', 'fitgirls', 'athleticgirls',
-            'gymgirls', 'yogapants', 'girlsinyogapants',
-            'assinyogapants', 'tightshorts', 'tightsqueeze',
-            'altgonewild', 'gothsluts', 'bigtiddygothgf',
-            'suicidegirls', 'tattooed_girls', 'hotchickswithtattoos',
-            'girlswithneonhair', 'hairypussy', 'razorfree',
-            'gonewild30plus', 'gonewild40plus', 'onmywildside',
-            'slutwife', 'wouldyoubonemywife', 'wifepictrading',
-            'nudes', 'nude', 'nudeselfies', 'snapchatsext',
-            'sextingfriendfinder', 'dirtySnapchat',
-            'onlyfanspromo', 'onlyfansadvice', 'fansly_advice',
-            'sexsells', 'usedpanties', 'pantyselling',
-            'nsfwskyrim', 'rule34lol', 'rule34overwatch',
-            'overwatchporn', 'leagueoflegends34', 'pokeporn',
-            'slutsofsnapchat', 'dirtysnapchat', 'snapchat_sluts',
-            'festivalsluts', 'trashyboners', 'trashy',
-            'wincest', 'incest', 'incestporn',
-            'gayporn', 'gaypornhunters', 'gaybrosgonewild',
-            'ladybonersgw', 'massivecock', 'penis',
-            'twinks', 'femboys', 'traps', 'sissies',
-            'transgonewild', 'transdiy', 'mtfbutts',
-            'pegging', 'strapon', 'gentlefemdom',
-            # NSFW indicators in subreddit name
-            'gonewild', 'nsfw', 'porn', 'xxx', 'nude', 'naked',
-            'sex', 'hentai', 'rule34', 'cumslut', 'slut', 'whore',
-            'milf', 'gilf', 'dilf', 'pawg', 'bwc', 'bbc',
-            '18+', 'adult', 'explicit'
-        ]
+        self._off_hours_sleep_sent = False  # Off-Hours Sleep notification sent for this night
+        self._next_wake_ts = None  # Epoch time the current off-hours sleep ends (None = not sleeping)
         
         # Load saved cooldown info
         self.load_cooldown()
+        
+        # Start notification worker thread
+        if self.ntfy_url:
+            self.notification_thread = threading.Thread(target=self.notification_worker, daemon=True)
+            self.notification_thread.start()
+    
+    def reset_task_state(self):
+        """Forget the tracked task (after submission, a missed deadline, or an expired assignment)"""
+        self.task_claimed_at = None
+        self.task_deadline = None
+        self.task_deadline_mono = None
+        self.cancel_deadline_warnings()
+        self.current_task_id = None
+        self.current_task_type = None
+        self._assigned_task_notified = False
+    
+    def track_task_deadline(self, claimed_at, deadline):
+        """
+        Record claim time and deadline (naive IST) plus a monotonic copy of the deadline,
+        and schedule the deadline warnings (kept as-is if this deadline already has them)
+        """
+        rescheduling = deadline != self.task_deadline or not self.deadline_warning_timers
+        self.task_claimed_at = claimed_at
+        self.task_deadline = deadline
+        # Countdown against the monotonic clock so wall-clock adjustments can't skew it
+        self.task_deadline_mono = time.monotonic() + (deadline - self.get_ist_now()).total_seconds()
+        if rescheduling:
+            self.schedule_deadline_warnings()
+    
+    def schedule_deadline_warnings(self):
+        """
+        Start one timer per deadline warning, so each fires on time without the main loop
+        polling for it. A warning whose time has already come (but not the next one's)
+        fires right away; warnings already superseded by a later one are skipped.
+        """
+        self.cancel_deadline_warnings()
+        seconds_left = self.task_seconds_left()
+        if seconds_left is None or seconds_left <= 0:
+            return
+        
+        next_offsets = [offset for offset, *_ in DEADLINE_WARNINGS[1:]] + [0]
+        for (offset, title, emoji, priority, tags), next_offset in zip(DEADLINE_WARNINGS, next_offsets):
+            if seconds_left > next_offset:
+                timer = threading.Timer(max(0.0, seconds_left - offset), self.send_deadline_warning,
+                                        args=(title, emoji, priority, tags))
+                timer.daemon = True
+                timer.start()
+                self.deadline_warning_timers.append(timer)
+    
+    def cancel_deadline_warnings(self):
+        """Stop any deadline warning timers that haven't fired yet"""
+        for timer in self.deadline_warning_timers:
+            timer.cancel()
+        self.deadline_warning_timers = []
+    
+    def send_deadline_warning(self, title, emoji, priority, tags):
+        """Timer callback: send one deadline warning with the time actually left"""
+        seconds_left = self.task_seconds_left()
+        task_deadline = self.task_deadline
+        if seconds_left is None or seconds_left <= 0 or task_deadline is None:
+            return
+        if seconds_left >= 3600:
+            left = f"{seconds_left / 3600:.1f}h"
+            logger.warning(f"⚠️ Task deadline approaching: {left} remaining")
+        else:
+            left = f"{seconds_left / 60:.0f}min"
+            logger.warning(f"🚨 URGENT: Task deadline in {left}!")
+        self.send_notification(
+            title,
+            f"{emoji} {left}\n🕐 {task_deadline.strftime('%I:%M %p IST')}",
+            priority=priority,
+            tags=tags
+        )
+    
+    def task_seconds_left(self, now_mono=None):
+        """Seconds until the tracked task's deadline (negative once passed), or None if no task"""
+        if self.task_deadline_mono is None:
+            return None
+        if now_mono is None:
+            now_mono = time.monotonic()
+        return self.task_deadline_mono - now_mono
     
     def get_ist_now(self):
         """Get current time in IST as a naive datetime (for consistency with stored times)"""
-        ist = pytz.timezone('Asia/Kolkata')
-        return datetime.now(ist).replace(tzinfo=None)
+        return datetime.now(IST).replace(tzinfo=None)
     
     def load_cooldown(self):
         """Load cooldown information from file. Returns True if loaded, False otherwise."""
         try:
             if os.path.exists(self.cooldown_file):
-                with open(self.cooldown_file, 'r') as f:
+                with open(self.cooldown_file, 'rb') as f:
                     content = f.read().strip()
                     if content:  # Only parse if file is not empty
-                        data = json.loads(content)
+                        data = _loads(content)
+                        # 'ts' (epoch seconds) is authoritative; files written by older
+                        # versions only have the naive IST 'cooldown_end' string
+                        ts = data.get('ts')
                         cooldown_str = data.get('cooldown_end')
-                        if cooldown_str:
+                        if ts is not None:
+                            self.cooldown_end = _epoch_to_ist_naive(ts)
+                        elif cooldown_str:
                             self.cooldown_end = datetime.fromisoformat(cooldown_str)
-                            return True
+                        else:
+                            return False
+                        # Files without a source predate it - treat them as local, so they
+                        # are only ever cleared once they expire (the old behaviour)
+                        self.cooldown_from_server = data.get('source') == 'server'
+                        self._saved_cooldown_end = (self.cooldown_end, self.cooldown_from_server)
+                        return True
             return False
         except json.JSONDecodeError as e:
-            print(f"⚠️ Error loading cooldown (corrupted file): {e}")
+            logger.warning(f"⚠️ Error loading cooldown (corrupted file): {e}")
             return False
-        except Exception as e:
-            print(f"⚠️ Error loading cooldown: {e}")
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"⚠️ Error loading cooldown: {e}")
             return False
     
-    def save_cooldown(self, cooldown_end):
-        """Save cooldown information to file. Returns True if saved, False on error."""
+    def save_cooldown(self, cooldown_end, from_server=True):
+        """
+        Save cooldown information to file. Returns True if saved (or already saved), False on error.
+        from_server: False for a cooldown the bot started itself, which the server doesn't
+                     know about and so can't cancel
+        The file is only rewritten when the value changes, via a temp file and an atomic
+        rename so a crash mid-write can't leave it corrupted.
+        """
         try:
             self.cooldown_end = cooldown_end
-            with open(self.cooldown_file, 'w') as f:
+            self.cooldown_from_server = from_server and cooldown_end is not None
+            saved = (cooldown_end, self.cooldown_from_server)
+            if saved == self._saved_cooldown_end and os.path.exists(self.cooldown_file):
+                return True
+            
+            tmp_file = self.cooldown_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
                 if cooldown_end is None:
-                    json.dump({}, f)  # Write empty object instead of null
+                    f.write(_dumps({}))  # Write empty object instead of null
                 else:
-                    json.dump({'cooldown_end': cooldown_end.isoformat()}, f)
+                    # Human-readable end time plus the epoch the bot actually loads
+                    f.write(_dumps({
+                        'cooldown_end': cooldown_end.isoformat(),
+                        'ts': self._cooldown_end_ts,
+                        'source': 'server' if self.cooldown_from_server else 'local',
+                    }))
+            os.replace(tmp_file, self.cooldown_file)
+            self._saved_cooldown_end = saved
             return True
         except Exception as e:
-            print(f"⚠️ Error saving cooldown: {e}")
+            logger.warning(f"⚠️ Error saving cooldown: {e}")
             return False
     
+    @property
+    def cooldown_end(self):
+        """End of the current cooldown as a naive IST datetime (for display and saving), or None"""
+        return self._cooldown_end
+    
+    @cooldown_end.setter
+    def cooldown_end(self, value):
+        self._cooldown_end = value
+        # Epoch copy so the per-tick cooldown checks are plain float comparisons
+        self._cooldown_end_ts = _ist_naive_to_epoch(value) if value is not None else None
+    
     def is_in_cooldown(self):
         """Check if currently in cooldown period"""
-        if self.cooldown_end is None:
-            return False
-        # All datetimes are stored as naive (no timezone)
-        return self.get_ist_now() < self.cooldown_end
+        return self._cooldown_end_ts is not None and time.time() < self._cooldown_end_ts
     
-    def get_cooldown_remaining(self):
-        """Get remaining cooldown time"""
-        if self.cooldown_end is None:
-            return None
-        # All datetimes are stored as naive (no timezone)
-        remaining = self.cooldown_end - self.get_ist_now()
-        if remaining.total_seconds() <= 0:
+    def cooldown_seconds_left(self):
+        """Seconds until the cooldown ends, or None if there is no cooldown or it has passed"""
+        if self._cooldown_end_ts is None:
             return None
-        return remaining
+        seconds_left = self._cooldown_end_ts - time.time()
+        return seconds_left if seconds_left > 0 else None
+    
+    def get_cooldown_remaining(self):
+        """Get remaining cooldown time as a timedelta (for display), or None"""
+        seconds_left = self.cooldown_seconds_left()
+        return timedelta(seconds=seconds_left) if seconds_left else None
+    
+    def schedule_cooldown_alerts(self):
+        """
+        Start one timer per cooldown alert that is still ahead, so each fires on time
+        without the main loop having to wake up for it. No-op if the current cooldown
+        already has its alerts scheduled.
+        """
+        if self.cooldown_end == self._alerts_cooldown_end:
+            return
+        self.cancel_cooldown_alerts()
+        seconds_left = self.cooldown_seconds_left()
+        if not seconds_left:
+            return
+        
+        self._alerts_cooldown_end = self.cooldown_end
+        for offset, title, emoji, priority, tags in COOLDOWN_ALERTS:
+            if seconds_left > offset:
+                timer = threading.Timer(seconds_left - offset, self.send_cooldown_alert,
+                                        args=(title, emoji, priority, tags))
+                timer.daemon = True
+                timer.start()
+                self.cooldown_alert_timers.append(timer)
+    
+    def cancel_cooldown_alerts(self):
+        """Stop any cooldown alert timers that haven't fired yet"""
+        for timer in self.cooldown_alert_timers:
+            timer.cancel()
+        self.cooldown_alert_timers = []
+        self._alerts_cooldown_end = None
     
-    def send_notification(self, title, message, priority="default", tags=None, delay_after=0.5):
+    def send_cooldown_alert(self, title, emoji, priority, tags):
+        """Timer callback: send one cooldown alert with the time actually left"""
+        seconds_left = self.cooldown_seconds_left()
+        if not seconds_left:
+            return
+        self.send_notification(
+            title,
+            f"{emoji} {int(seconds_left / 60)}min\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
+            priority=priority,
+            tags=tags
+        )
+    
+    def send_notification(self, title, message, priority="default", tags=None, delay_after=0.5, dedupe=True):
         """
-        Send notification via ntfy with retry logic and rate limiting
+        Queue a notification for delivery by the background notification worker.
+        Never blocks: if the queue is full the lowest-priority pending notification (oldest
+        among equals) is evicted to make room, unless the new one ranks lower still - then
+        the new one is dropped instead and False is returned.
         
         Args:
             title: Notification title
             message: Notification message body
             priority: Priority level (urgent, high, default, low)
             tags: Emoji/icon tags for notification
-            delay_after: Seconds to wait after successful send (prevents rate limiting)
+            delay_after: Seconds the worker waits after a successful send (prevents rate limiting)
+            dedupe: Skip if the same title+message was sent within NOTIFICATION_DEDUPE_TTL
+                    (pass False for direct replies to commands)
+        
+        Returns True if the notification was queued (or is a recent duplicate), False if ntfy
+        is not configured or the queue was full of higher-priority notifications.
         """
         if not self.ntfy_url:
-            print(f"⚠️ No ntfy URL configured, skipping notification")
+            logger.debug(f"⚠️ No ntfy URL configured, skipping notification")
             return False
-            
+        
+        if dedupe:
+            key = hash((title, message))
+            now = time.monotonic()
+            with self.recent_notifications_lock:
+                sent_at = self.recent_notifications.get(key)
+                if sent_at is not None and now - sent_at < NOTIFICATION_DEDUPE_TTL:
+                    logger.debug(f"🔁 Skipping duplicate notification: {title}")
+                    return True
+                # Forget expired entries once the table grows, to keep it bounded
+                if len(self.recent_notifications) >= 100:
+                    self.recent_notifications = {
+                        k: t for k, t in self.recent_notifications.items()
+                        if now - t < NOTIFICATION_DEDUPE_TTL
+                    }
+                self.recent_notifications[key] = now
+        
+        item = (title, message, priority, tags, delay_after)
+        dropped = None
+        queued = True
+        with self.notification_cond:
+            pending = self.notification_queue
+            if len(pending) >= NOTIFICATION_QUEUE_SIZE:
+                # Make room by dropping the lowest-priority pending notification (oldest among
+                # equals), unless the new one ranks even lower - then it is the one dropped
+                rank = NOTIFICATION_PRIORITY_RANK.get
+                victim = min(range(len(pending)), key=lambda i: rank(pending[i][2], 3))
+                if rank(priority, 3) < rank(pending[victim][2], 3):
+                    dropped = title
+                    queued = False
+                else:
+                    dropped = pending[victim][0]
+                    del pending[victim]
+            if queued:
+                pending.append(item)
+                self.notification_cond.notify_all()
+        
+        if dropped is not None:
+            logger.warning(f"⚠️ Notification queue full, dropped: {dropped}")
+        return queued
+    
+    def notification_worker(self):
+        """Background thread that delivers queued notifications in order"""
+        cond = self.notification_cond
+        while True:
+            with cond:
+                while not self.notification_queue:
+                    cond.wait()
+                item = self.notification_queue.popleft()
+                self.notification_delivering = True
+            try:
+                self.deliver_notification(*item)
+            except Exception as e:
+                print(f"❌ Error in notification worker: {e}")
+            finally:
+                with cond:
+                    self.notification_delivering = False
+                    cond.notify_all()
+    
+    def flush_notifications(self, timeout=10):
+        """Wait up to timeout seconds for queued notifications to be delivered. Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        with self.notification_cond:
+            while self.notification_queue or self.notification_delivering:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.notification_cond.wait(remaining)
+        return True
+    
+    def deliver_notification(self, title, message, priority="default", tags=None, delay_after=0.5):
+        """
+        Send notification via ntfy with retry logic and rate limiting (blocking).
+        Called from the notification worker thread; use send_notification() elsewhere.
+        """
         try:
-            # Remove emojis and non-Latin-1 characters from title for HTTP header compatibility
-            # HTTP headers must be Latin-1 compatible and cannot have leading/trailing whitespace
-            clean_title = title.encode('latin-1', errors='ignore').decode('latin-1').strip()
-            if not clean_title:
-                # If title becomes empty after removing emojis, use a default
-                clean_title = "TaskFlux Notification"
-            
-            headers = {
-                "Priority": priority,
-                "Title": clean_title,
-                "Content-Type": "text/plain; charset=utf-8"
-            }
-            if tags:
-                headers["Tags"] = tags
+            headers = _ntfy_headers(title, priority, tags)
+            clean_title = headers["Title"]
             
             # Send full message (including emojis) as UTF-8 encoded bytes
             # Include original title with emojis in the message body
@@ -278,7 +814,7 @@ class TaskFluxBot:
             max_retries = 3  # Increased from 2 to 3
             for attempt in range(max_retries):
                 try:
-                    response = requests.post(
+                    response = self.ntfy_session.post(
                         self.ntfy_url,
                         data=full_message.encode('utf-8'),
                         headers=headers,
@@ -353,7 +889,7 @@ class TaskFluxBot:
                         if line:
                             try:
                                 # Parse JSON message
-                                data = json.loads(line.decode('utf-8'))
+                                data = _loads(line)
                                 message = data.get('message', '').strip().lower()
                                 
                                 # Ignore empty messages
@@ -374,6 +910,7 @@ class TaskFluxBot:
                                 # Add command to queue
                                 print(f"📥 Received command: {message}")
                                 self.command_queue.put(message)
+                                self.wake_event.set()
                                 
                             except json.JSONDecodeError:
                                 # Skip non-JSON lines (e.g., keepalive)
@@ -402,6 +939,36 @@ class TaskFluxBot:
         
         print("👋 Command listener stopped")
     
+    def sleep_interruptible(self, seconds, wake_early=False):
+        """
+        Wait up to `seconds`, handling incoming commands as soon as they arrive
+        instead of only between fixed sleep chunks.
+        wake_early: Return right after handling a command instead of waiting out the rest
+        Returns True if the wait was cut short by a wake request (SIGUSR1).
+        """
+        deadline = time.monotonic() + seconds
+        while not self.stop_listener:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Wait in slices of at most 10s so Ctrl+C stays responsive on Windows
+            if self.wake_event.wait(min(remaining, 10)):
+                self.wake_event.clear()
+                self.process_commands()
+                if self.wake_requested:
+                    self.wake_requested = False
+                    return True
+                if wake_early:
+                    break
+        return False
+    
+    def request_wake(self, signum=None, frame=None):
+        """SIGUSR1 handler: end the current wait so the loop re-checks the server immediately"""
+        self.wake_requested = True
+        # Set the event from a helper thread: the main thread may be inside wake_event.wait()
+        # holding its internal lock when the handler runs
+        threading.Thread(target=self.wake_event.set, daemon=True).start()
+    
     def process_commands(self):
         """Process any pending commands from the queue (non-blocking)"""
         while not self.command_queue.empty():
@@ -426,7 +993,8 @@ class TaskFluxBot:
                         "Unknown Command",
                         f"❓ '{command}'\n📝 Send 'commands' for help",
                         priority="low",
-                        tags="question"
+                        tags="question",
+                        dedupe=False
                     )
                     
             except queue.Empty:
@@ -441,7 +1009,8 @@ class TaskFluxBot:
                 "Already Paused",
                 "⏸️ Bot is already paused",
                 priority="low",
-                tags="pause_button"
+                tags="pause_button",
+                dedupe=False
             )
         else:
             self.is_paused = True
@@ -450,7 +1019,8 @@ class TaskFluxBot:
                 "Bot Paused",
                 "⏸️ Bot will not claim new tasks\n✅ Monitoring assigned tasks continues\n💬 Send 'unpause' to resume",
                 priority="default",
-                tags="pause_button"
+                tags="pause_button",
+                dedupe=False
             )
     
     def handle_unpause(self):
@@ -460,7 +1030,8 @@ class TaskFluxBot:
                 "Already Running",
                 "▶️ Bot is already running",
                 priority="low",
-                tags="arrow_forward"
+                tags="arrow_forward",
+                dedupe=False
             )
         else:
             self.is_paused = False
@@ -469,25 +1040,24 @@ class TaskFluxBot:
                 "Bot Running",
                 "▶️ Bot resumed\n🎯 Will claim tasks when available",
                 priority="default",
-                tags="arrow_forward"
+                tags="arrow_forward",
+                dedupe=False
             )
     
     def handle_status(self):
         """Handle status command - send comprehensive bot status"""
-        ist = pytz.timezone('Asia/Kolkata')
-        current_time = datetime.now(ist)
+        current_time = datetime.now(IST)
         
-        # Build status message
-        status_msg = f"🕐 {current_time.strftime('%I:%M %p IST')}\n"
+        # Build status message (one line per entry, joined once at the end)
+        lines = [f"🕐 {current_time.strftime('%I:%M %p IST')}"]
         
         # Bot state
-        state = "⏸️ PAUSED" if self.is_paused else "▶️ RUNNING"
-        status_msg += f"{state}\n"
+        lines.append("⏸️ PAUSED" if self.is_paused else "▶️ RUNNING")
         
         # Active hours
         start_12h = f"{self.claim_start_hour % 12 or 12} {'AM' if self.claim_start_hour < 12 else 'PM'}"
         end_12h = f"{self.claim_end_hour % 12 or 12} {'AM' if self.claim_end_hour < 12 else 'PM'}"
-        status_msg += f"⏰ Active: {start_12h}-{end_12h}\n"
+        lines.append(f"⏰ Active: {start_12h}-{end_12h}")
         
         # Cooldown status
         if self.is_in_cooldown():
@@ -496,44 +1066,48 @@ class TaskFluxBot:
                 hours = remaining.total_seconds() / 3600
                 minutes = (remaining.total_seconds() % 3600) / 60
                 if hours >= 1:
-                    status_msg += f"⏳ Cooldown: {int(hours)}h {int(minutes)}m\n"
+                    lines.append(f"⏳ Cooldown: {int(hours)}h {int(minutes)}m")
                 else:
-                    status_msg += f"⏳ Cooldown: {int(minutes)}m\n"
+                    lines.append(f"⏳ Cooldown: {int(minutes)}m")
         else:
-            status_msg += "✅ Ready to claim\n"
+            lines.append("✅ Ready to claim")
         
         # Assigned task status
-        if self.task_claimed_at and self.task_deadline:
-            time_remaining = self.task_deadline - self.get_ist_now()
-            if time_remaining.total_seconds() > 0:
-                hours_remaining = time_remaining.total_seconds() / 3600
-                status_msg += f"📋 Task: {hours_remaining:.1f}h left"
+        seconds_left = self.task_seconds_left()
+        if self.task_claimed_at and seconds_left is not None:
+            if seconds_left > 0:
+                hours_remaining = seconds_left / 3600
+                lines.append(f"📋 Task: {hours_remaining:.1f}h left")
             else:
-                status_msg += "📋 Task: Overdue"
+                lines.append("📋 Task: Overdue")
         else:
-            status_msg += "📋 No task"
+            lines.append("📋 No task")
         
         # Send status
         self.send_notification(
             "Bot Status",
-            status_msg,
+            "\n".join(lines),
             priority="default",
-            tags="bar_chart"
+            tags="bar_chart",
+            dedupe=False
         )
     
     def handle_commands(self):
         """Handle commands/help command - list all available commands"""
-        help_msg = "⏸️ pause - Pause claiming\n"
-        help_msg += "▶️ unpause - Resume claiming\n"
-        help_msg += "📊 status - Bot status\n"
-        help_msg += "⏰ time 8-23 - Set hours\n"
-        help_msg += "📝 help - Show commands"
+        help_msg = "\n".join((
+            "⏸️ pause - Pause claiming",
+            "▶️ unpause - Resume claiming",
+            "📊 status - Bot status",
+            "⏰ time 8-23 - Set hours",
+            "📝 help - Show commands",
+        ))
         
         self.send_notification(
             "Bot Commands",
             help_msg,
             priority="default",
-            tags="information_source"
+            tags="information_source",
+            dedupe=False
         )
     
     def handle_time(self, command):
@@ -562,6 +1136,7 @@ class TaskFluxBot:
             # Update claiming hours
             self.claim_start_hour = start_hour
             self.claim_end_hour = end_hour
+            self._next_wake_ts = None  # Cut any off-hours sleep short so the new window applies
             
             print(f"⏰ Claiming hours updated: {start_hour}:00 - {end_hour}:00 IST")
             
@@ -573,20 +1148,24 @@ class TaskFluxBot:
                 "Hours Updated",
                 f"⏰ Claiming: {start_12h} - {end_12h} IST\n✅ Active for {end_hour - start_hour} hours/day",
                 priority="default",
-                tags="clock"
+                tags="clock",
+                dedupe=False
             )
             
         except ValueError as e:
-            error_msg = "❌ Invalid format\n"
-            error_msg += "📝 Use: time START-END\n"
-            error_msg += "Example: time 8-23\n"
-            error_msg += "⏰ Hours: 0-23 (24h format)"
+            error_msg = "\n".join((
+                "❌ Invalid format",
+                "📝 Use: time START-END",
+                "Example: time 8-23",
+                "⏰ Hours: 0-23 (24h format)",
+            ))
             
             self.send_notification(
                 "Invalid Time",
                 error_msg,
                 priority="low",
-                tags="x"
+                tags="x",
+                dedupe=False
             )
         except Exception as e:
             print(f"⚠️ Error parsing time command: {e}")
@@ -594,9 +1173,90 @@ class TaskFluxBot:
                 "Time Error",
                 f"⚠️ {str(e)}",
                 priority="low",
-                tags="warning"
+                tags="warning",
+                dedupe=False
             )
     
+    def warm_connections(self, count=2):
+        """
+        Open `count` keep-alive connections to the API up front (concurrent HEADs),
+        so the first concurrent poll and the first claim don't pay for TLS handshakes.
+        """
+        def head():
+            try:
+                self.session.head(self.base_url, timeout=5)
+            except requests.exceptions.RequestException:
+                pass  # Best effort - the real request will simply connect itself
+        
+        futures = [self.http_pool.submit(head) for _ in range(count)]
+        for future in futures:
+            future.result()
+    
+    def cached_get(self, url, ttl=POLL_CACHE_TTL):
+        """
+        GET a JSON endpoint, reusing a successful response fetched less than ttl seconds ago.
+        Once that expires the request is made conditional on the response's ETag (or its
+        Last-Modified date when the server sends no ETag), so an unchanged resource comes
+        back as a bodiless 304 and the cached data is reused.
+        Concurrent callers for the same URL wait for a single request.
+        Returns (status_code, data) - data is None for non-200 responses.
+        """
+        lock = self.poll_cache_locks.setdefault(url, threading.Lock())
+        with lock:
+            cached = self.poll_cache.get(url)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1], cached[2]
+            
+            headers = None
+            if cached:
+                if cached[3]:
+                    headers = {"If-None-Match": cached[3]}
+                elif cached[4]:
+                    headers = {"If-Modified-Since": cached[4]}
+            response = self.session.get(url, headers=headers, timeout=POLL_TIMEOUT)
+            if response.status_code == 304 and cached:
+                self.poll_cache[url] = (time.monotonic(),) + cached[1:]
+                return cached[1], cached[2]
+            if response.status_code != 200:
+                return response.status_code, None
+            
+            data = _json(response)
+            self.poll_cache[url] = (time.monotonic(), response.status_code, data,
+                                    response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return response.status_code, data
+    
+    def invalidate_poll_cache(self):
+        """Drop cached GET responses (call after any request that changes server state)"""
+        self.poll_cache.clear()
+    
+    def fetch_task_pool(self):
+        """
+        The task pool as a PoolSnapshot, read through the poll cache so every check in one
+        tick shares a single request. The snapshot is indexed once per distinct response
+        (a cache hit or 304 returns the same data object, so it is reused as-is).
+        Returns (status_code, snapshot) - snapshot is None for non-200 responses.
+        """
+        status, data = self.cached_get(self.task_pool_url)
+        if status != 200:
+            return status, None
+        
+        cached = self._pool_snapshot
+        if cached and cached[0] is data:
+            return status, cached[1]
+        
+        # Might be a direct array or nested under 'tasks'
+        snapshot = _index_task_pool(data if isinstance(data, list) else data.get('tasks', []))
+        self._pool_snapshot = (data, snapshot)
+        return status, snapshot
+    
+    def find_my_assigned_task(self, snapshot):
+        """First task in the pool assigned to us and still in 'assigned' state, or None"""
+        return next(
+            (t for t in snapshot.by_assignee.get(self.user_id, ())
+             if (t.get('status') or '').lower() == 'assigned'),
+            None
+        )
+    
     def login(self):
         """Login to TaskFlux"""
         max_retries = 3
@@ -620,25 +1280,27 @@ class TaskFluxBot:
                     # TaskFlux uses cookie-based authentication (accessToken cookie)
                     # The session automatically handles cookies, no need to manually set headers
                     
+                    # Start the first tick's polls in the background while the login response
+                    # is parsed; the main loop then finds them in the poll cache (or, once
+                    # that has expired, revalidates them with a cheap conditional GET)
+                    for url in (self.task_pool_url, self.can_assign_url):
+                        self.http_pool.submit(self.cached_get, url)
+                    
                     # Try to get user data from response
                     user_data = None
                     try:
-                        data = response.json()
+                        data = _json(response)
                         if 'user' in data:
                             user_data = data['user']
-                            self.user_id = user_data.get('_id') or user_data.get('id')
+                            self.user_id = _first(user_data, '_id', 'id')
                         elif '_id' in data:
                             self.user_id = data.get('_id')
                             user_data = data
-                    except:
+                    except (ValueError, AttributeError):
                         pass
                     
                     print(f"✅ Login successful!")
                     
-                    # Get IST time
-                    ist = pytz.timezone('Asia/Kolkata')
-                    current_ist = datetime.now(ist)
-                    
                     self.send_notification(
                         "Bot Started",
                         f"🧑‍💻 {self.email}",
@@ -686,273 +1348,233 @@ class TaskFluxBot:
         
         return False
     
-    def sync_cooldown_from_server(self):
-        """Sync cooldown from server (NO notifications sent here). Returns True if cooldown found, False otherwise."""
+    def sync_cooldown_from_server(self, force=False):
+        """
+        Sync cooldown from server (NO notifications sent here). Returns True if cooldown found, False otherwise.
+        
+        Args:
+            force: Ask the server even if the local cooldown has a while left, and accept
+                   a server-side cancel or change of a cooldown the server reported (one the
+                   bot started itself, e.g. after a missed deadline, still runs to its end)
+        """
+        # Normally a known cooldown can't end early - skip the request until it's nearly over
+        seconds_left = self.cooldown_seconds_left()
+        if not force and seconds_left and seconds_left > COOLDOWN_RESYNC_WINDOW:
+            return True
+        
         try:
-            check_url = f"{self.base_url}/api/tasks/can-assign-task-to-self"
-            response = self.session.get(check_url, timeout=10)
+            check_url = self.can_assign_url
+            status, data = self.cached_get(check_url)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 default_data = data.get('default', {})
                 can_claim = default_data.get('canAssign', True)
                 allowed_after = default_data.get('allowedAfter')
                 
                 if not can_claim and allowed_after:
                     # Parse cooldown time from server (UTC) and convert to IST naive datetime
-                    cooldown_end_utc = datetime.fromisoformat(allowed_after.replace('Z', '+00:00'))
-                    ist = pytz.timezone('Asia/Kolkata')
-                    utc = pytz.UTC
-                    
-                    # Ensure UTC timezone, convert to IST, then remove timezone info
-                    if cooldown_end_utc.tzinfo is None:
-                        cooldown_end_utc = utc.localize(cooldown_end_utc)
-                    cooldown_end_ist = cooldown_end_utc.astimezone(ist).replace(tzinfo=None)
+                    cooldown_end_ist = _to_ist_naive(allowed_after)
                     
                     # Save cooldown as naive datetime
                     self.save_cooldown(cooldown_end_ist)
                     return True
                 else:
-                    # No cooldown on server
-                    if self.cooldown_end and self.get_ist_now() >= self.cooldown_end:
+                    # No cooldown on server - drop ours once it has expired, or early (when
+                    # forced) if it came from the server, which has now lifted it
+                    if self.cooldown_end and (
+                        not self.is_in_cooldown() or (force and self.cooldown_from_server)
+                    ):
                         self.cooldown_end = None
                         self.save_cooldown(None)
                     return False
             else:
-                print(f"⚠️ Failed to sync cooldown: HTTP {response.status_code}")
+                logger.warning(f"⚠️ Failed to sync cooldown: HTTP {status}")
                 return False
                         
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout syncing cooldown from server")
+            logger.warning(f"⚠️ Timeout syncing cooldown from server")
             return False
         except Exception as e:
-            print(f"⚠️ Error syncing cooldown: {e}")
+            logger.warning(f"⚠️ Error syncing cooldown: {e}")
             return False
     
     def can_claim_task(self):
-        """Check if we can claim a task (not in cooldown). Returns True if can claim, False on definite restriction."""
+        """
+        Check if we can claim a task (not in cooldown). Returns True if can claim, False on definite restriction.
+        Reads through the poll cache, so it shares the can-assign response this tick's
+        assigned-task check and cooldown sync already fetched instead of requesting it again.
+        """
         try:
-            check_url = f"{self.base_url}/api/tasks/can-assign-task-to-self"
-            response = self.session.get(check_url, timeout=10)
+            check_url = self.can_assign_url
+            status, data = self.cached_get(check_url)
             
-            if response.status_code == 200:
-                data = response.json()
-                # Response format might be: {"canClaim": true/false} or similar
-                can_claim = data.get('canClaim') or data.get('canAssign') or data.get('allowed', True)
-                return can_claim
+            if status == 200:
+                # The flags live in the 'default' object, like sync_cooldown_from_server reads them
+                default_data = data.get('default', data)
+                return default_data.get('canAssign', default_data.get('canClaim', True))
             else:
-                print(f"⚠️ Failed to check claim status: HTTP {response.status_code}")
+                logger.warning(f"⚠️ Failed to check claim status: HTTP {status}")
                 # If endpoint fails, assume we can try
                 return True
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout checking claim status")
+            logger.warning(f"⚠️ Timeout checking claim status")
             return True
         except Exception as e:
-            print(f"⚠️ Error checking claim status: {e}")
+            logger.warning(f"⚠️ Error checking claim status: {e}")
             return True
     
-    def get_available_tasks(self):
-        """Fetch available tasks from task-pool and filter out assigned ones"""
+    def get_available_tasks(self, snapshot=None):
+        """
+        Fetch available tasks from task-pool and filter out assigned ones
+        snapshot: a PoolSnapshot this tick already fetched (fetched here if not given)
+        """
         try:
             # TaskFlux uses task-pool endpoint for available tasks
-            tasks_url = f"{self.base_url}/api/tasks/task-pool"
-            
-            response = self.session.get(tasks_url, timeout=10)
+            if snapshot is None:
+                status_code, snapshot = self.fetch_task_pool()
+            else:
+                status_code = 200
             
-            if response.status_code == 200:
-                tasks = response.json()
-                # Return tasks array - might be direct array or nested
-                all_tasks = tasks if isinstance(tasks, list) else tasks.get('tasks', [])
+            if status_code == 200:
+                # Unassigned, unpublished tasks in a claimable state (copied, since the
+                # caller may reorder it and the snapshot is shared until the pool changes)
+                available_tasks = list(snapshot.available)
                 
-                # Filter out tasks that are already assigned
-                available_tasks = []
-                for task in all_tasks:
-                    status = task.get('status', '').lower()
-                    assigned_to = task.get('assignedTo', '')
-                    is_published = task.get('isPublished', False)
-                    
-                    # Skip tasks that are:
-                    # - Already assigned to someone
-                    # - Published (completed)
-                    # - In invalid states
-                    if assigned_to:
-                        # Task is assigned to someone
-                        if assigned_to == self.user_id:
-                            # This is our assigned task - track it but don't add to available
-                            assigned_at = task.get('assignedAt') or task.get('createdAt')
+                # If a task assigned to us shows up and we aren't tracking one yet,
+                # pick up its deadline (skipped entirely once a deadline is tracked)
+                if not self.task_claimed_at:
+                    for task in snapshot.by_assignee.get(self.user_id, ()):
+                        assigned_at = _first(task, 'assignedAt', 'createdAt')
+                        if not assigned_at:
+                            continue
+                        try:
+                            # Parse times from server (UTC) and convert to IST naive
+                            claimed_time = _to_ist_naive(assigned_at)
+                            
+                            # Use assignmentDeadline if available, otherwise calculate 6 hours
                             assignment_deadline = task.get('assignmentDeadline')
+                            if assignment_deadline:
+                                deadline_time = _to_ist_naive(assignment_deadline)
+                            else:
+                                deadline_time = claimed_time + timedelta(hours=6)
                             
-                            if assigned_at and not self.task_claimed_at:
-                                try:
-                                    # Parse times from server (UTC) and convert to IST naive
-                                    ist = pytz.timezone('Asia/Kolkata')
-                                    utc = pytz.UTC
-                                    
-                                    claimed_time_utc = datetime.fromisoformat(assigned_at.replace('Z', '+00:00'))
-                                    if claimed_time_utc.tzinfo is None:
-                                        claimed_time_utc = utc.localize(claimed_time_utc)
-                                    claimed_time = claimed_time_utc.astimezone(ist).replace(tzinfo=None)
-                                    
-                                    # Use assignmentDeadline if available, otherwise calculate 6 hours
-                                    if assignment_deadline:
-                                        deadline_time_utc = datetime.fromisoformat(assignment_deadline.replace('Z', '+00:00'))
-                                        if deadline_time_utc.tzinfo is None:
-                                            deadline_time_utc = utc.localize(deadline_time_utc)
-                                        deadline_time = deadline_time_utc.astimezone(ist).replace(tzinfo=None)
-                                    else:
-                                        deadline_time = claimed_time + timedelta(hours=6)
-                                    
-                                    self.task_claimed_at = claimed_time
-                                    self.task_deadline = deadline_time
-                                except Exception as e:
-                                    pass
-                        # Don't add assigned tasks to available list
-                        continue
-                    
-                    # Skip published/completed tasks
-                    if is_published or status in ['published', 'completed', 'expired', 'cancelled']:
-                        continue
-                    
-                    # Only include truly available tasks
-                    if status in ['assignment-pending', 'pending', 'available', 'active']:
-                        available_tasks.append(task)
+                            self.track_task_deadline(claimed_time, deadline_time)
+                            break
+                        except Exception:
+                            pass
                 
                 return available_tasks
             else:
-                print(f"⚠️ Failed to fetch tasks: HTTP {response.status_code}")
+                logger.warning(f"⚠️ Failed to fetch tasks: HTTP {status_code}")
                 return []
                 
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout fetching tasks from server")
+            logger.warning(f"⚠️ Timeout fetching tasks from server")
             return []
         except Exception as e:
-            print(f"⚠️ Error fetching tasks: {e}")
+            logger.warning(f"⚠️ Error fetching tasks: {e}")
             return []
     
     def claim_task(self, task_id, task_details=None):
         """Claim a specific task"""
         try:
-            print(f"🎯 Attempting to claim task {task_id}...")
+            logger.info(f"🎯 Attempting to claim task {task_id}...")
             
             # TaskFlux claim endpoint - taskId in URL path
             claim_url = f"{self.base_url}/api/tasks/assign-task-to-self/{task_id}"
             
             response = self.session.put(claim_url, timeout=15)
+            # Claim attempts change task-pool and can-assign state on the server
+            self.invalidate_poll_cache()
             
             if response.status_code == 200:
                 try:
-                    task_data = response.json()
-                except:
+                    task_data = _json(response)
+                except ValueError:
                     task_data = {}
                     
-                print(f"✅ Task claimed successfully!")
-                
-                # Calculate 6-hour deadline (IST timezone)
-                ist = pytz.timezone('Asia/Kolkata')
-                claim_time_aware = datetime.now(ist)
-                deadline_time_aware = claim_time_aware + timedelta(hours=6)
+                logger.info(f"✅ Task claimed successfully!")
                 
-                # Store deadline for tracking (convert to naive datetime for consistency)
-                self.task_claimed_at = claim_time_aware.replace(tzinfo=None)
-                self.task_deadline = deadline_time_aware.replace(tzinfo=None)
+                # Calculate 6-hour deadline (naive IST, like every stored time - IST has no DST,
+                # so plain arithmetic on it is exact)
+                claim_now = self.get_ist_now()
+                self.track_task_deadline(claim_now, claim_now + timedelta(hours=6))
                 
                 # Use naive datetimes for display
                 claim_time = self.task_claimed_at
                 deadline_time = self.task_deadline
-                self.deadline_warning_sent = False
-                self.deadline_final_warning_sent = False
                 
                 # DON'T start cooldown yet - wait for task completion
                 # Just send notification about task assignment
                 
                 # Build detailed notification message
-                task_type = task_data.get('type') or (task_details.get('type') if task_details else 'N/A')
-                task_price = task_data.get('price') or (task_details.get('price') if task_details else None)
+                task_details = task_details or {}
+                task_type = _first(task_data, 'type') or _first(task_details, 'type') or 'N/A'
+                task_price = _first(task_data, 'price') or _first(task_details, 'price')
                 
                 # Default to $2.00 if price is not available
                 if task_price is None or task_price == 'N/A':
                     task_price = '2.00'
                 
-                # Try to get subreddit and title from various fields
-                subreddit = None
-                title = None
-                submit_url = None
-                
-                if task_data:
-                    subreddit = task_data.get('subreddit') or task_data.get('subredditName')
-                    title = task_data.get('title') or task_data.get('postTitle')
-                    submit_url = task_data.get('submitUrl') or task_data.get('submissionUrl')
-                
-                if task_details and not subreddit:
-                    subreddit = task_details.get('subreddit') or task_details.get('subredditName')
-                    title = task_details.get('title') or task_details.get('postTitle')
-                    submit_url = task_details.get('submitUrl') or task_details.get('submissionUrl')
+                # Try to get subreddit and title from various fields,
+                # preferring the claim response over the task-pool entry
+                subreddit = (_first(task_data, 'subreddit', 'subredditName')
+                             or _first(task_details, 'subreddit', 'subredditName'))
+                title = _first(task_data, 'title', 'postTitle') or _first(task_details, 'title', 'postTitle')
+                submit_url = (_first(task_data, 'submitUrl', 'submissionUrl')
+                              or _first(task_details, 'submitUrl', 'submissionUrl'))
                 
                 # ═══════════════════════════════════════════════════════════
                 # PRINT DETAILED TASK INFO IN TERMINAL
+                # Built as one block and written once so it can't interleave
+                # with output from the listener thread
                 # ═══════════════════════════════════════════════════════════
-                print(f"\n{'═'*60}")
-                print(f"🎯 TASK DETAILS")
-                print(f"{'═'*60}")
-                print(f"📋 Type: {task_type.upper()}")
-                print(f"💵 Price: ${task_price}")
-                print(f"🆔 Task ID: {task_id}")
-                print(f"⏰ Claimed at: {claim_time.strftime('%I:%M:%S %p IST')}")
-                print(f"⏰ DEADLINE: {deadline_time.strftime('%I:%M %p IST')} (6 hours)")
-                print(f"📅 Date: {deadline_time.strftime('%B %d, %Y')}")
-                
+                deadline_str = deadline_time.strftime('%I:%M %p IST')  # Banner and notification
+                lines = _task_banner(f"🎯 TASK DETAILS", task_type.upper(), task_price, task_id)
+                lines += (
+                    f"⏰ Claimed at: {claim_time.strftime('%I:%M:%S %p IST')}",
+                    f"⏰ DEADLINE: {deadline_str} (6 hours)",
+                    f"📅 Date: {deadline_time.strftime('%B %d, %Y')}",
+                )
+
                 if subreddit:
-                    print(f"{'─'*60}")
-                    if subreddit.startswith('r/'):
-                        print(f"📍 Subreddit: {subreddit}")
-                        print(f"🔗 URL: https://www.reddit.com/{subreddit}")
-                    else:
-                        print(f"📍 Subreddit: r/{subreddit}")
-                        print(f"🔗 URL: https://www.reddit.com/r/{subreddit}")
-                
+                    sub_display = subreddit if subreddit.startswith('r/') else f"r/{subreddit}"
+                    lines.append(f"{'─'*60}")
+                    lines.append(f"📍 Subreddit: {sub_display}")
+                    lines.append(f"🔗 URL: https://www.reddit.com/{sub_display}")
+
                 if title:
-                    print(f"{'─'*60}")
-                    print(f"📝 Post Title:")
-                    # Word wrap for long titles
-                    if len(title) > 56:
-                        words = title.split()
-                        line = "   "
-                        for word in words:
-                            if len(line) + len(word) + 1 > 60:
-                                print(line)
-                                line = "   " + word
-                            else:
-                                line += " " + word if line != "   " else word
-                        if line != "   ":
-                            print(line)
-                    else:
-                        print(f"   {title}")
-                
-                print(f"{'─'*60}")
+                    lines.append(f"{'─'*60}")
+                    lines.append(f"📝 Post Title:")
+                    # Word wrap long titles to 60 columns
+                    lines.append(textwrap.fill(title, width=60, initial_indent="   ", subsequent_indent="   "))
+
+                lines.append(f"{'─'*60}")
+                lines.append(f"🔗 Submit URL:")
                 if submit_url:
-                    print(f"🔗 Submit URL:")
-                    print(f"   {submit_url}")
+                    lines.append(f"   {submit_url}")
                 else:
-                    print(f"🔗 Submit URL:")
-                    print(f"   https://taskflux.net/tasks/{task_id}/submission")
-                
-                print(f"{'─'*60}")
-                print(f"⚠️  WARNING: Complete within 6 hours or lose task!")
-                print(f"✅ After completion: 24-hour cooldown starts")
-                print(f"{'═'*60}\n")
+                    lines.append(f"   https://taskflux.net/tasks/{task_id}/submission")
+
+                lines.append(f"{'─'*60}")
+                lines.append(f"⚠️  WARNING: Complete within 6 hours or lose task!")
+                lines.append(f"✅ After completion: 24-hour cooldown starts")
+                lines.append(f"{'═'*60}\n")
+                logger.info("\n".join(lines))
                 
-                # Calculate time left until deadline
-                time_left = deadline_time - self.get_ist_now()
-                hours_left = time_left.total_seconds() / 3600
+                # Calculate time left until deadline (from the monotonic deadline just tracked)
+                hours_left = self.task_seconds_left() / 3600
                 
                 # Format notification with only necessary info
-                task_info = f"🎯 Type: {task_type.upper()}\n"
-                task_info += f"💵 Price: ${task_price}\n"
-                task_info += f"⏰ Deadline: {deadline_time.strftime('%I:%M %p IST')}\n"
-                task_info += f"⏳ Time Left: {hours_left:.1f}h"
+                task_info = "\n".join((
+                    f"🎯 Type: {task_type.upper()}",
+                    f"💵 Price: ${task_price}",
+                    f"⏰ Deadline: {deadline_str}",
+                    f"⏳ Time Left: {hours_left:.1f}h",
+                ))
                 
                 # HIGHEST PRIORITY - Task assignment is most critical
-                success = self.send_notification(
+                self.send_notification(
                     "Task Assigned",
                     task_info,
                     priority="urgent",
@@ -960,89 +1582,102 @@ class TaskFluxBot:
                     delay_after=1.5  # 1.5 second delay after this critical notification
                 )
                 
-                if not success:
-                    print(f"⚠️ Failed to send 'Task Assigned' notification, retrying once...")
-                    time.sleep(2)
-                    self.send_notification(
-                        "Task Assigned",
-                        task_info,
-                        priority="urgent",
-                        tags="dart",
-                        delay_after=1.5
-                    )
-                
                 return True
             elif response.status_code == 400:
                 # Task not available to claim (already assigned, invalid status, etc.)
-                print(f"⚠️ Task not available: {response.status_code}")
+                logger.warning(f"⚠️ Task not available: {response.status_code}")
                 try:
-                    error_data = response.json()
+                    error_data = _json(response)
                     error_msg = error_data.get('msg', 'Unknown error')
-                    print(f"   Reason: {error_msg}")
-                except:
-                    print(f"   Response: {response.text}")
+                    logger.warning(f"   Reason: {error_msg}")
+                except (ValueError, AttributeError):
+                    logger.warning(f"   Response: {response.text}")
                 return False
             else:
-                print(f"❌ Failed to claim task: HTTP {response.status_code}")
-                print(f"   Response: {response.text}")
+                logger.warning(f"❌ Failed to claim task: HTTP {response.status_code}")
+                logger.warning(f"   Response: {response.text}")
                 return False
         
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout claiming task {task_id}")
+            logger.warning(f"⚠️ Timeout claiming task {task_id}")
             return False
         except Exception as e:
-            print(f"❌ Error claiming task: {e}")
+            logger.warning(f"❌ Error claiming task: {e}")
             return False
     
 
     
     def get_task_summary(self):
-        """Fetch task summary to get total amount earned. Returns dict on success, None on error."""
+        """
+        Fetch task summary to get total amount earned. Returns a TaskSummary on success, None on error.
+        A successful result is reused for TASK_SUMMARY_TTL seconds (cleared when a submission is detected).
+        """
+        cached = self._task_summary_cache
+        if cached and time.monotonic() - cached[0] < TASK_SUMMARY_TTL:
+            return cached[1]
+        
         try:
             summary_url = f"{self.base_url}/api/tasks/task-summary"
             response = self.session.get(summary_url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                total_amount = data.get('totalAmount', 0)
-                total_payouts = data.get('totalPayouts', 0)
-                remaining_payout = data.get('remainingPayout', 0)
-                
-                return {
-                    'totalAmount': total_amount,
-                    'totalPayouts': total_payouts,
-                    'remainingPayout': remaining_payout
-                }
+                data = _json(response)
+                summary = TaskSummary(
+                    total_amount=data.get('totalAmount', 0),
+                    total_payouts=data.get('totalPayouts', 0),
+                    remaining_payout=data.get('remainingPayout', 0),
+                )
+                self._task_summary_cache = (time.monotonic(), summary)
+                return summary
             else:
-                print(f"⚠️ Failed to fetch task summary: HTTP {response.status_code}")
+                logger.warning(f"⚠️ Failed to fetch task summary: HTTP {response.status_code}")
                 return None
                 
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout fetching task summary")
+            logger.warning(f"⚠️ Timeout fetching task summary")
             return None
         except Exception as e:
-            print(f"⚠️ Error fetching task summary: {e}")
+            logger.warning(f"⚠️ Error fetching task summary: {e}")
             return None
     
+    def send_payout_notification(self):
+        """Fetch the remaining payout and notify (run from a timer after a submission)"""
+        try:
+            logger.info(f"📊 Fetching task summary for payout...")
+            task_summary = self.get_task_summary()
+            remaining_payout = task_summary.remaining_payout if task_summary else 0
+            logger.info(f"💰 Remaining payout: ${remaining_payout}")
+            
+            logger.info(f"📤 Sending payout notification...")
+            self.send_notification(
+                "Payout Amount",
+                f"💵 ${remaining_payout}",
+                priority="default",
+                tags="dollar",
+                delay_after=1.0
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Error sending payout notification: {e}")
+    
     def check_task_completion(self):
         """
         Check if task was submitted by detecting cooldown on server.
-        Flow: Task Submitted notification → 3min sleep → Payout notification → 30s sleep → return
+        Flow: sync cooldown → Task Submitted notification (with the cooldown) →
+        schedule Payout notification (3 min, background) → return
         Returns True if task submitted, False otherwise.
-        Note: Main loop handles cooldown sync and "Cooldown Started" notification.
         """
         if not self.task_claimed_at:
             return False
             
         try:
-            print(f"🔍 Checking for task submission (cooldown detection)...")
+            logger.info(f"🔍 Checking for task submission (cooldown detection)...")
             
-            # Check server for cooldown
-            check_url = f"{self.base_url}/api/tasks/can-assign-task-to-self"
-            response = self.session.get(check_url, timeout=10)
+            # Check server for cooldown - always revalidated (ttl=0) so a submission is never
+            # missed on a reused response; unchanged state still comes back as a cheap 304
+            check_url = self.can_assign_url
+            status, data = self.cached_get(check_url, ttl=0)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 default_data = data.get('default', {})
                 can_claim = default_data.get('canAssign', True)
                 allowed_after = default_data.get('allowedAfter')
@@ -1054,105 +1689,74 @@ class TaskFluxBot:
                 if not can_claim and allowed_after:
                     # Check if it's cooldown (not just assigned task)
                     if 'only perform' in reason.lower() or '24 hours' in reason.lower():
-                        print(f"✅ Cooldown detected - Task was submitted!")
-                        print(f"   Reason: {reason}")
+                        logger.info(f"✅ Cooldown detected - Task was submitted!")
+                        logger.info(f"   Reason: {reason}")
                         
-                        # STEP 1: Send "Task Submitted" notification
-                        print(f"📤 Sending 'Task Submitted' notification...")
-                        success = self.send_notification(
-                            "Task Submitted",
-                            f"✅ Completed",
-                            priority="high",
-                            tags="white_check_mark",
-                            delay_after=1.0
-                        )
-                        
-                        if not success:
-                            print(f"⚠️ Failed to send 'Task Submitted' notification, retrying after 3s...")
-                            time.sleep(3)
-                            self.send_notification(
-                                "Task Submitted",
-                                f"✅ Completed",
-                                priority="high",
-                                tags="white_check_mark",
-                                delay_after=1.0
-                            )
+                        # STEP 1: Take the new cooldown from the response just fetched, even if
+                        # an older local cooldown is still on record, and announce both at once
+                        self.sync_cooldown_from_server(force=True)
+                        self.notify_task_submitted()
                         
-                        # STEP 2: Sleep 3 minutes
-                        print(f"⏳ Sleeping 3 minutes before fetching payout...")
-                        time.sleep(180)  # 3 minutes
+                        # STEP 2: Fetch payout in the background once the server has settled it,
+                        # so deadline checks and commands keep running in the meantime
+                        logger.info(f"⏳ Payout notification scheduled in 3 minutes...")
+                        payout_timer = threading.Timer(180, self.send_payout_notification)
+                        payout_timer.daemon = True
+                        payout_timer.start()
                         
-                        # STEP 3: Get payout and send notification
-                        print(f"📊 Fetching task summary for payout...")
-                        task_summary = self.get_task_summary()
-                        remaining_payout = task_summary.get('remainingPayout', 0) if task_summary else 0
-                        print(f"💰 Remaining payout: ${remaining_payout}")
+                        # Clear task tracking; earnings change with this submission
+                        self.reset_task_state()
+                        self._task_summary_cache = None
                         
-                        print(f"📤 Sending payout notification...")
-                        success = self.send_notification(
-                            "Payout Amount",
-                            f"💵 ${remaining_payout}",
-                            priority="default",
-                            tags="dollar",
-                            delay_after=1.0
-                        )
-                        
-                        if not success:
-                            print(f"⚠️ Failed to send payout notification, retrying after 3s...")
-                            time.sleep(3)
-                            self.send_notification(
-                                "Payout Amount",
-                                f"💵 ${remaining_payout}",
-                                priority="default",
-                                tags="money_bag",
-                                delay_after=1.0
-                            )
-                        
-                        # STEP 4: Sleep 5 seconds before cooldown sync
-                        print(f"⏳ Sleeping 5s before cooldown sync...")
-                        time.sleep(5)
-                        
-                        # Clear task tracking
-                        self.task_claimed_at = None
-                        self.task_deadline = None
-                        self.deadline_warning_sent = False
-                        self.deadline_final_warning_sent = False
-                        self.current_task_id = None
-                        self.current_task_type = None
-                        
-                        print(f"✅ Task completion detected!")
+                        logger.info(f"✅ Task completion detected!")
                         return True
                     else:
                         # Still have assigned task, not cooldown yet
-                        print(f"📋 Task still assigned - reason: {reason}")
+                        logger.info(f"📋 Task still assigned - reason: {reason}")
                         return False
             
-            print(f"📋 No cooldown detected - task still in progress")
+            logger.info(f"📋 No cooldown detected - task still in progress")
             return False
             
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout checking task completion")
+            logger.warning(f"⚠️ Timeout checking task completion")
             return False
         except Exception as e:
-            print(f"⚠️ Error checking task completion: {e}")
+            logger.warning(f"⚠️ Error checking task completion: {e}")
             return False
     
-    def check_task_deadline(self):
-        """Check if task deadline is approaching and send warnings"""
+    def notify_task_submitted(self):
+        """Send one notification for a submission, including the cooldown it started"""
+        message = "✅ Completed"
+        seconds_left = self.cooldown_seconds_left()
+        if seconds_left:
+            message += f"\n⌛ {seconds_left / 3600:.1f}h\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}"
+        
+        logger.info(f"📤 Sending 'Task Submitted' notification...")
+        self.send_notification(
+            "Task Submitted",
+            message,
+            priority="high",
+            tags="white_check_mark,hourglass",
+            delay_after=1.0
+        )
+    
+    def check_task_deadline(self, now_mono=None):
+        """
+        Handle a missed task deadline (the 2h / 30min warnings come from timers
+        started by track_task_deadline)
+        now_mono: time.monotonic() of the current loop tick (read here if not given)
+        """
         if not self.task_deadline:
             return  # No active task
         
-        # Use naive datetime for consistency (all stored datetimes are naive)
-        now = self.get_ist_now()
         task_deadline = self.task_deadline
-        
-        time_remaining = task_deadline - now
-        hours_remaining = time_remaining.total_seconds() / 3600
+        hours_remaining = self.task_seconds_left(now_mono) / 3600
         
         # Check if deadline has passed
         if hours_remaining <= 0:
-            print(f"❌ DEADLINE PASSED! Task may be lost!")
-            print(f"🔄 Syncing with server to check cooldown status...")
+            logger.warning(f"❌ DEADLINE PASSED! Task may be lost!")
+            logger.info(f"🔄 Syncing with server to check cooldown status...")
             
             # Sync with server to get the actual cooldown
             self.sync_cooldown_from_server()
@@ -1167,18 +1771,14 @@ class TaskFluxBot:
             
             # If server didn't start cooldown, start it locally (24 hours)
             if not self.is_in_cooldown():
-                print(f"⏰ Server hasn't started cooldown - starting 24h cooldown locally")
+                logger.info(f"⏰ Server hasn't started cooldown - starting 24h cooldown locally")
                 cooldown_end = self.get_ist_now() + timedelta(hours=24)
-                self.save_cooldown(cooldown_end)
+                self.save_cooldown(cooldown_end, from_server=False)
                 
-                # Format cooldown time for notification (already in IST as naive datetime)
-                ist = pytz.timezone('Asia/Kolkata')
-                cooldown_end_aware = ist.localize(cooldown_end)
-                
-                # Send cooldown notification
+                # Send cooldown notification (cooldown_end is already naive IST - format it directly)
                 self.send_notification(
                     "Cooldown Started",
-                    f"⌛ 24h (Missed)\n🕐 {cooldown_end_aware.strftime('%I:%M %p IST')}",
+                    f"⌛ 24h (Missed)\n🕐 {cooldown_end.strftime('%I:%M %p IST')}",
                     priority="high",
                     tags="hourglass"
                 )
@@ -1186,55 +1786,32 @@ class TaskFluxBot:
                 # Server already started cooldown
                 remaining = self.get_cooldown_remaining()
                 hours_cd = remaining.total_seconds() / 3600 if remaining else 0
-                print(f"✅ Server cooldown active: {hours_cd:.1f}h remaining until {self.cooldown_end.strftime('%I:%M %p IST')}")
+                logger.info(f"✅ Server cooldown active: {hours_cd:.1f}h remaining until {self.cooldown_end.strftime('%I:%M %p IST')}")
             
             # Clear deadline tracking
-            self.task_claimed_at = None
-            self.task_deadline = None
-            self.deadline_warning_sent = False
-            self.deadline_final_warning_sent = False
-            self.current_task_id = None
-            self.current_task_type = None
-            
-            # Reset assigned task notification flag
-            if hasattr(self, '_assigned_task_notified'):
-                self._assigned_task_notified = False
-            
-            return
-        
-        # Send warning at 2 hours remaining
-        if hours_remaining <= 2 and not self.deadline_warning_sent:
-            print(f"⚠️ Task deadline approaching: {hours_remaining:.1f}h remaining")
-            self.send_notification(
-                "2 Hours Left",
-                f"⚠️ {hours_remaining:.1f}h\n🕐 {task_deadline.strftime('%I:%M %p IST')}",
-                priority="high",
-                tags="warning"
-            )
-            self.deadline_warning_sent = True
-        
-        # Send final warning at 30 minutes remaining
-        elif hours_remaining <= 0.5 and not self.deadline_final_warning_sent:
-            minutes_remaining = hours_remaining * 60
-            print(f"🚨 URGENT: Task deadline in {minutes_remaining:.0f} minutes!")
-            self.send_notification(
-                "30 Minutes Left",
-                f"🚨 {minutes_remaining:.0f}min\n🕐 {task_deadline.strftime('%I:%M %p IST')}",
-                priority="urgent",
-                tags="fire"
-            )
-            self.deadline_final_warning_sent = True
+            self.reset_task_state()
     
     def check_for_assigned_task_on_server(self):
         """Check if there's an assigned task on the server"""
+        return self.poll_assigned_task()[0]
+    
+    def poll_assigned_task(self):
+        """
+        Check if there's an assigned task on the server, fetching can-assign and the task
+        pool concurrently. Returns (has_assigned_task, snapshot) - snapshot is the task
+        pool fetched alongside, or None if it wasn't needed or couldn't be fetched.
+        """
         try:
+            check_url = self.can_assign_url
+            
+            # Request both endpoints concurrently so the check costs one round trip, not two
+            check_future = self.http_pool.submit(self.cached_get, check_url)
+            pool_future = self.http_pool.submit(self.fetch_task_pool)
+            
             # Method 1: Check can-assign-task-to-self endpoint (fastest)
-            check_url = f"{self.base_url}/api/tasks/can-assign-task-to-self"
-            response = self.session.get(check_url, timeout=10)
+            check_status, data = check_future.result()
             
-            if response.status_code == 200:
-                data = response.json()
-                
+            if check_status == 200:
                 # Check the 'default' object for task assignment status
                 default_data = data.get('default', {})
                 can_assign = default_data.get('canAssign', True)
@@ -1244,131 +1821,97 @@ class TaskFluxBot:
                 if not can_assign:
                     # Check if the reason indicates an assigned task
                     if 'assigned task' in reason.lower() or 'complete it before' in reason.lower():
-                        return True
+                        return True, None
             
             # Method 2: Check task-pool for tasks assigned to us (most reliable)
-            tasks_url = f"{self.base_url}/api/tasks/task-pool"
-            pool_response = self.session.get(tasks_url, timeout=10)
+            pool_status, snapshot = pool_future.result()
             
-            if pool_response.status_code == 200:
-                pool_data = pool_response.json()
-                all_tasks = pool_data if isinstance(pool_data, list) else pool_data.get('tasks', [])
-                
+            if pool_status == 200:
                 # Check if any task is assigned to us
-                for task in all_tasks:
-                    status = task.get('status', '').lower()
-                    assigned_to = task.get('assignedTo', '')
-                    
-                    if status == 'assigned' and assigned_to == self.user_id:
-                        return True
+                return self.find_my_assigned_task(snapshot) is not None, snapshot
                     
-            return False
+            return False, None
         
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout checking for assigned task on server")
-            return False
+            logger.warning(f"⚠️ Timeout checking for assigned task on server")
+            return False, None
         except Exception as e:
-            print(f"⚠️ Error checking for assigned task: {e}")
-            return False
+            logger.warning(f"⚠️ Error checking for assigned task: {e}")
+            return False, None
     
-    def check_for_running_task(self, send_notification=True):
+    def check_for_running_task(self, send_notification=True, now_mono=None):
         """
         Check if there's a running/assigned task on the server
         send_notification: If False, skips sending notifications (for status updates only)
+        now_mono: time.monotonic() of the current loop tick (read here if not given)
         """
         try:
             # Use task-pool endpoint to get actual task details
             # task-summary only has statistics (completed count, payout numbers)
-            tasks_url = f"{self.base_url}/api/tasks/task-pool"
-            response = self.session.get(tasks_url, timeout=10)
+            # The assigned-task check already fetched it this tick (poll cache)
+            status, snapshot = self.fetch_task_pool()
             
-            if response.status_code != 200:
+            if status != 200:
                 return False
             
-            data = response.json()
-            all_tasks = data if isinstance(data, list) else data.get('tasks', [])
+            task = self.find_my_assigned_task(snapshot)
             
-            # Filter for tasks assigned to us
-            assigned_tasks = []
-            for task in all_tasks:
-                status = task.get('status', '').lower()
-                assigned_to = task.get('assignedTo', '')
-                
-                # Check if this task is assigned to us
-                if status == 'assigned' and assigned_to == self.user_id:
-                    assigned_tasks.append(task)
-            
-            if not assigned_tasks:
+            if task is None:
                 return False
             
-            # Found assigned task(s)
-            print(f"⚠️ Found {len(assigned_tasks)} assigned task(s) on server!")
+            # Found assigned task
+            logger.info(f"⚠️ Found assigned task on server!")
             
-            # Get the first assigned task
-            task = assigned_tasks[0]
-            task_id = task.get('_id') or task.get('id') or task.get('taskId', 'unknown')
+            task_id = _first(task, '_id', 'id', 'taskId') or 'unknown'
             task_type = task.get('type', 'N/A')
-            task_price = task.get('microWorkerPrice') or task.get('price', None)
+            task_price = _first(task, 'microWorkerPrice', 'price')
             
             # Default to $2.00 if price is not available
             if task_price is None or task_price == 'N/A':
                 task_price = '2.00'
             
-            assigned_at = task.get('assignedAt') or task.get('createdAt')
+            assigned_at = _first(task, 'assignedAt', 'createdAt')
             assignment_deadline = task.get('assignmentDeadline')
             
             # Calculate deadline
-            ist = pytz.timezone('Asia/Kolkata')
             if assigned_at:
                 try:
                     # Parse times from server (UTC) and convert to IST naive
-                    utc = pytz.UTC
-                    
-                    claimed_time_utc = datetime.fromisoformat(assigned_at.replace('Z', '+00:00'))
-                    if claimed_time_utc.tzinfo is None:
-                        claimed_time_utc = utc.localize(claimed_time_utc)
-                    claimed_time = claimed_time_utc.astimezone(ist).replace(tzinfo=None)
+                    claimed_time = _to_ist_naive(assigned_at)
                     
                     # Use assignmentDeadline if available, otherwise calculate 6 hours
                     if assignment_deadline:
-                        deadline_time_utc = datetime.fromisoformat(assignment_deadline.replace('Z', '+00:00'))
-                        if deadline_time_utc.tzinfo is None:
-                            deadline_time_utc = utc.localize(deadline_time_utc)
-                        deadline_time = deadline_time_utc.astimezone(ist).replace(tzinfo=None)
+                        deadline_time = _to_ist_naive(assignment_deadline)
                     else:
                         deadline_time = claimed_time + timedelta(hours=6)
                     
                     # Store deadline tracking
-                    self.task_claimed_at = claimed_time
-                    self.task_deadline = deadline_time
-                    self.deadline_warning_sent = False
-                    self.deadline_final_warning_sent = False
+                    self.track_task_deadline(claimed_time, deadline_time)
                     
                     # Store current task ID and type for status tracking
                     self.current_task_id = task_id
                     self.current_task_type = task_type
                     
-                    # Calculate time remaining
-                    time_remaining = deadline_time - datetime.now()
-                    hours_remaining = time_remaining.total_seconds() / 3600
+                    # Calculate time remaining (from the monotonic deadline just tracked)
+                    hours_remaining = self.task_seconds_left(now_mono) / 3600
                     
-                    print(f"\n{'═'*60}")
-                    print(f"⚠️ ASSIGNED TASK DETECTED")
-                    print(f"{'═'*60}")
-                    print(f"📋 Type: {task_type}")
-                    print(f"💵 Price: ${task_price}")
-                    print(f"🆔 Task ID: {task_id}")
-                    print(f"⏰ Assigned at: {claimed_time.strftime('%I:%M:%S %p IST')}")
-                    print(f"⏰ DEADLINE: {deadline_time.strftime('%I:%M %p IST')}")
-                    print(f"⏳ Time remaining: {hours_remaining:.1f}h")
-                    print(f"{'═'*60}\n")
+                    # Banner written in one call so it can't interleave with other threads' output
+                    deadline_str = deadline_time.strftime('%I:%M %p IST')
+                    lines = _task_banner(f"⚠️ ASSIGNED TASK DETECTED", task_type, task_price, task_id)
+                    lines += (
+                        f"⏰ Assigned at: {claimed_time.strftime('%I:%M:%S %p IST')}",
+                        f"⏰ DEADLINE: {deadline_str}",
+                        f"⏳ Time remaining: {hours_remaining:.1f}h",
+                        f"{'═'*60}\n",
+                    )
+                    logger.info("\n".join(lines))
                     
                     # Send notification only if requested (avoid duplicates)
                     if send_notification:
                         if hours_remaining > 0:
                             self.send_notification(
                                 "Assigned Task Found",
-                                f"📋 {task_type}\n💵 ${task_price}\n🕐 {deadline_time.strftime('%I:%M %p IST')}\n⏳ {hours_remaining:.1f}h left",
+                                f"📋 {task_type}\n💵 ${task_price}\n🕐 {deadline_str}\n⏳ {hours_remaining:.1f}h left",
                                 priority="urgent",
                                 tags="pushpin"
                             )
@@ -1376,17 +1919,17 @@ class TaskFluxBot:
                             # Deadline already passed
                             self.send_notification(
                                 "Task Deadline Passed",
-                                f"⛔ {task_type}\n💵 ${task_price}\n🕐 {deadline_time.strftime('%I:%M %p IST')}",
+                                f"⛔ {task_type}\n💵 ${task_price}\n🕐 {deadline_str}",
                                 priority="urgent",
                                 tags="no_entry"
                             )
                         
                 except Exception as e:
-                    print(f"⚠️ Could not parse task assignment time: {e}")
-                    print(f"   Raw time value: {assigned_at}")
+                    logger.warning(f"⚠️ Could not parse task assignment time: {e}")
+                    logger.warning(f"   Raw time value: {assigned_at}")
             else:
                 # No timestamp available, just notify about the task
-                print(f"⚠️ Assigned task found (ID: {task_id}) but no timestamp available")
+                logger.warning(f"⚠️ Assigned task found (ID: {task_id}) but no timestamp available")
                 
                 # Store task ID and type for status tracking
                 self.current_task_id = task_id
@@ -1404,30 +1947,95 @@ class TaskFluxBot:
             return True
         
         except requests.exceptions.Timeout:
-            print(f"⚠️ Timeout checking for running task")
+            logger.warning(f"⚠️ Timeout checking for running task")
             return False
         except Exception as e:
-            print(f"⚠️ Error checking for running task: {e}")
+            logger.warning(f"⚠️ Error checking for running task: {e}")
             return False
     
     def is_within_claiming_hours(self):
         """Check if current time is within allowed claiming hours (default: 8 AM - 11 PM IST)"""
         try:
-            ist = pytz.timezone('Asia/Kolkata')
-            current_time_ist = datetime.now(ist)
-            current_hour = current_time_ist.hour
+            # IST has a fixed +5:30 offset (no DST), so the hour is plain arithmetic on the epoch
+            current_hour = int((time.time() + IST_OFFSET_SECONDS) // 3600 % 24)
             
             # Use custom claiming hours (can be changed via 'time' command)
             # Default is 8 AM (8) to 11 PM (23)
             if self.claim_start_hour <= current_hour < self.claim_end_hour:
                 return True
             else:
-                print(f"⏰ Outside claiming hours ({self.claim_start_hour} AM - {self.claim_end_hour-1} PM IST). Current time: {current_time_ist.strftime('%I:%M %p IST')}")
+                current_time_ist = datetime.now(IST)
+                logger.info(f"⏰ Outside claiming hours ({self.claim_start_hour} AM - {self.claim_end_hour-1} PM IST). Current time: {current_time_ist.strftime('%I:%M %p IST')}")
                 return False
         except Exception as e:
-            print(f"⚠️ Error checking time: {e}")
+            logger.warning(f"⚠️ Error checking time: {e}")
             return True  # Default to allowing claims if error
     
+    def sleep_until_claiming_window(self, current_time):
+        """Sleep (handling commands) until the next claiming window opens, with Off-Hours/Awake notifications"""
+        now_ist = datetime.now(IST)
+        start_hour = self.claim_start_hour
+        
+        # Next start of the claiming window: later today if it hasn't opened yet, otherwise tomorrow
+        next_start = now_ist.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+        if now_ist.hour >= start_hour:
+            next_start += timedelta(days=1)
+        
+        time_until_start = next_start - now_ist
+        hours_until = (time_until_start.total_seconds() + 60) / 3600
+        
+        # Format hours for display (12-hour format, as in handle_time)
+        end_hour = self.claim_end_hour
+        start_12h = f"{start_hour % 12 or 12} {'AM' if start_hour < 12 else 'PM'}"
+        end_12h = f"{end_hour % 12 or 12} {'AM' if end_hour < 12 else 'PM'}"
+        
+        next_start_str = next_start.strftime('%I:%M %p IST')
+        logger.info("\n".join((
+            f"\n{'='*60}",
+            f"😴 OUTSIDE CLAIMING HOURS - {current_time}",
+            f"{'='*60}",
+            f"   Claiming allowed: {start_12h} - {end_12h} IST",
+            f"   Current time: {now_ist.strftime('%I:%M %p IST')}",
+            f"   Sleeping {hours_until:.1f}h until {start_12h} IST",
+            f"   Resume at: {next_start_str} on {next_start.strftime('%B %d')}",
+            f"{'='*60}",
+        )))
+        
+        # Send sleep notification on first sleep only
+        if not self._off_hours_sleep_sent:
+            self._off_hours_sleep_sent = True
+            self.send_notification(
+                "Off-Hours Sleep",
+                f"😴 {hours_until:.1f}h\n⏰ {next_start_str}\n🕐 Claiming: {start_12h} - {end_12h}",
+                priority="default",
+                tags="zzz"
+            )
+        
+        # Wait, handling commands as they arrive. The wake target is a wall-clock timestamp,
+        # re-checked every 10 minutes so a suspended host or clock change can't oversleep it.
+        # A 'time' command clears it, which ends the sleep so the new hours take effect.
+        self._next_wake_ts = next_start.timestamp() + 60
+        while self._next_wake_ts is not None and not self.stop_listener:
+            remaining = self._next_wake_ts - time.time()
+            if remaining <= 0:
+                break
+            if self.sleep_interruptible(min(remaining, 600), wake_early=True):
+                self._next_wake_ts = None  # Woken on request - re-check the window now
+        
+        if self._next_wake_ts is None:
+            logger.info(f"⏰ Woken early (hours changed or wake requested) - re-checking window")
+            return
+        self._next_wake_ts = None
+        
+        # Reset flag and send wake notification
+        self._off_hours_sleep_sent = False
+        self.send_notification(
+            "Bot Awake",
+            f"☀️ Ready!\n🕐 {next_start_str}",
+            priority="high",
+            tags="sunny"
+        )
+    
     def is_content_safe(self, content):
         """
         Check if task content is safe and unlikely to be removed by AutoMod or moderators
@@ -1437,54 +2045,47 @@ class TaskFluxBot:
         if not content:
             return True, "No content to check"
         
+        # Lowercased once; every pattern check below runs against it
         content_lower = content.lower()
         
         # Check for NSFW domains/links FIRST (highest priority)
-        for domain in self.nsfw_domains:
-            if domain in content_lower:
-                return False, f"Contains NSFW domain: '{domain}'"
+        match = self.nsfw_domain_re.search(content_lower)
+        if match:
+            return False, f"Contains NSFW domain: '{match.group(0)}'"
         
         # Check for suspicious patterns
-        for pattern in self.suspicious_patterns:
-            if pattern.lower() in content_lower:
-                return False, f"Contains suspicious pattern: '{pattern}'"
-        
-        # Check for URL patterns that might lead to NSFW content
-        import re
-        # Match common URL patterns
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, content_lower)
-        
-        for url in urls:
-            # Check each URL for NSFW indicators
-            for domain in self.nsfw_domains:
-                if domain in url:
-                    return False, f"Contains NSFW link: '{url[:50]}...'"
-            
-            # Check for NSFW path patterns
-            nsfw_paths = ['/nsfw', '/adult', '/xxx', '/18+', '/porn', '/nude', '/erotic']
-            for path in nsfw_paths:
-                if path in url:
-                    return False, f"URL contains NSFW path: '{path}'"
+        match = self.suspicious_re.search(content_lower)
+        if match:
+            return False, f"Contains suspicious pattern: '{match.group(0)}'"
+        
+        # Check URLs for NSFW path patterns (NSFW domains were already caught above)
+        for url in URL_RE.findall(content_lower):
+            match = NSFW_URL_PATH_RE.search(url)
+            if match:
+                return False, f"URL contains NSFW path: '{match.group(0)}'"
+        
+        # Count every character once; the checks below read from this tally
+        char_counts = Counter(content)
         
         # Check for excessive caps (>60% caps with minimum 15 letters)
         # AutoMod often flags ALL CAPS as spam
-        letters = [c for c in content if c.isalpha()]
-        if letters and len(letters) > 15:
-            caps_ratio = sum(1 for c in letters if c.isupper()) / len(letters)
+        letter_count = sum(n for c, n in char_counts.items() if c.isalpha())
+        if letter_count > 15:
+            caps_count = sum(n for c, n in char_counts.items() if c.isalpha() and c.isupper())
+            caps_ratio = caps_count / letter_count
             if caps_ratio > 0.6:
                 return False, "Excessive uppercase (possible spam)"
         
         # Check for excessive punctuation/special chars (>25%)
         # Multiple exclamation marks, dollar signs often trigger filters
-        special_chars = sum(1 for c in content if c in '!?$#@*')
+        special_chars = sum(char_counts[c] for c in '!?$#@*')
         if len(content) > 0:
             special_ratio = special_chars / len(content)
             if special_ratio > 0.25:
                 return False, "Excessive special characters"
         
         # Check for excessive emojis (>5 promotional emojis)
-        emoji_count = content.count('🔥') + content.count('💰') + content.count('💵') + content.count('🚀')
+        emoji_count = char_counts['🔥'] + char_counts['💰'] + char_counts['💵'] + char_counts['🚀']
         if emoji_count > 5:
             return False, "Excessive promotional emojis"
         
@@ -1495,9 +2096,8 @@ class TaskFluxBot:
         
         # Check for repetitive characters (6+ same char in a row)
         # "hahahahaha", "!!!!!!!!" commonly trigger spam filters
-        for char in set(content):
-            if content.count(char * 6) > 0:
-                return False, f"Repetitive characters detected"
+        if REPEATED_CHAR_RE.search(content):
+            return False, f"Repetitive characters detected"
         
         return True, "Content appears safe"
     
@@ -1510,24 +2110,22 @@ class TaskFluxBot:
         subreddit = None
         
         # Direct subreddit field
-        subreddit = task.get('subreddit', '') or task.get('targetSubreddit', '') or task.get('sub', '')
+        subreddit = _first(task, 'subreddit', 'targetSubreddit', 'sub')
         
         # Check in URL field
-        url = task.get('url', '') or task.get('link', '') or task.get('postUrl', '') or task.get('targetUrl', '')
+        url = _first(task, 'url', 'link', 'postUrl', 'targetUrl')
         if url and not subreddit:
             # Extract subreddit from Reddit URL (e.g., reddit.com/r/subreddit_name)
-            import re
-            match = re.search(r'reddit\.com/r/([a-zA-Z0-9_]+)', url)
+            match = REDDIT_URL_SUBREDDIT_RE.search(url)
             if match:
                 subreddit = match.group(1)
         
         # Check in content/description for subreddit mentions
         if not subreddit:
-            content = task.get('content', '') or task.get('description', '') or task.get('body', '') or task.get('text', '')
+            content = _first(task, 'content', 'description', 'body', 'text')
             if content:
-                import re
                 # Look for r/subreddit pattern
-                match = re.search(r'\br/([a-zA-Z0-9_]+)', content)
+                match = SUBREDDIT_MENTION_RE.search(content)
                 if match:
                     subreddit = match.group(1)
         
@@ -1537,58 +2135,41 @@ class TaskFluxBot:
         subreddit_lower = subreddit.lower().strip()
         
         # Check if exact match in NSFW subreddits list
-        if subreddit_lower in [s.lower() for s in self.nsfw_subreddits]:
+        if subreddit_lower in self.nsfw_subreddits:
             return True, subreddit
         
         # Check if subreddit contains any NSFW indicator keywords
-        nsfw_keywords = ['nsfw', 'gonewild', 'porn', 'xxx', 'nude', 'naked', 'sex', 
-                         'hentai', 'rule34', 'cumslut', 'slut', 'milf', 'gilf',
-                         'boobs', 'tits', 'ass', 'pussy', 'dick', 'cock', 'penis',
-                         '18+', 'adult', 'explicit', 'erotic', 'fetish', 'bdsm']
-        
-        for keyword in nsfw_keywords:
+        for keyword in NSFW_SUBREDDIT_KEYWORDS:
             if keyword in subreddit_lower:
                 return True, subreddit
         
         return False, subreddit
     
-    def check_and_claim_tasks(self):
-        """Check for available tasks and claim if not in cooldown"""
-        # First, check if we already have an assigned task on the server
-        if self.check_for_assigned_task_on_server():
-            # Task is assigned - don't check for new tasks
-            if self.task_deadline:
-                time_remaining = self.task_deadline - self.get_ist_now()
-                hours_remaining = time_remaining.total_seconds() / 3600
-                
-                if hours_remaining > 0:
-                    # Task still active, skip checking for new tasks
-                    return False
-            
-            # No local deadline tracking, skip anyway
-            return False
+    def check_and_claim_tasks(self, now_mono=None):
+        """
+        Check for available tasks and claim if not in cooldown
+        now_mono: time.monotonic() of the current loop tick (read here if not given)
+        """
+        if now_mono is None:
+            now_mono = time.monotonic()
         
-        # Also check local task tracking (fallback) - IMPORTANT for preventing double claims
+        # Check local task tracking first - IMPORTANT for preventing double claims.
+        # A live local deadline means a task is in progress, so the tick needs no HTTP at all
+        # (the server would only confirm it, and we'd skip claiming either way)
         if self.current_task_id or self.task_claimed_at or self.task_deadline:
-            # We have local tracking of a task
-            if self.task_deadline:
-                # Use naive datetime for comparison (stored deadline is naive)
-                now = self.get_ist_now()
-                time_remaining = self.task_deadline - now
-            else:
-                time_remaining = timedelta(0)
-                
-            hours_remaining = time_remaining.total_seconds() / 3600
-            
-            if hours_remaining > 0:
+            if self.task_deadline and self.task_seconds_left(now_mono) > 0:
                 # Task still active, skip checking for new tasks
                 return False
-            else:
-                # Deadline passed, clear tracking
-                self.task_claimed_at = None
-                self.task_deadline = None
-                self.current_task_id = None
-                self.current_task_type = None
+            # Deadline passed (or no deadline tracked), clear tracking
+            self.reset_task_state()
+        
+        # Then check if there's an assigned task on the server we aren't tracking.
+        # This fetches can-assign and the task pool concurrently; the pool snapshot is
+        # kept for the task search below and the cooldown sync reuses the can-assign response
+        has_assigned_task, pool_snapshot = self.poll_assigned_task()
+        if has_assigned_task:
+            # Task is assigned - don't check for new tasks
+            return False
         
         # Sync cooldown status from server first
         self.sync_cooldown_from_server()
@@ -1597,111 +2178,100 @@ class TaskFluxBot:
         if self.is_in_cooldown():
             remaining = self.get_cooldown_remaining()
             hours = remaining.total_seconds() / 3600
-            print(f"⏳ Server sync updated cooldown: {hours:.1f}h remaining until {self.cooldown_end.strftime('%I:%M %p IST')}")
+            logger.info(f"⏳ Server sync updated cooldown: {hours:.1f}h remaining until {self.cooldown_end.strftime('%I:%M %p IST')}")
             return False
         
         # Check if within allowed claiming hours (8 AM - 11 PM IST)
         if not self.is_within_claiming_hours():
             return False
         
-        print(f"🔍 Checking for available tasks...")
-        tasks = self.get_available_tasks()
+        logger.info(f"🔍 Checking for available tasks...")
+        tasks = self.get_available_tasks(pool_snapshot)
         
         if not tasks:
             self.consecutive_empty_checks += 1
-            print(f"📭 No tasks available at the moment (empty check #{self.consecutive_empty_checks})")
+            logger.info(f"📭 No tasks available at the moment (empty check #{self.consecutive_empty_checks})")
             return False
         
         # Tasks found - reset empty check counter
         if self.consecutive_empty_checks > 0:
-            print(f"✨ Tasks appeared after {self.consecutive_empty_checks} empty checks!")
+            logger.info(f"✨ Tasks appeared after {self.consecutive_empty_checks} empty checks!")
         self.consecutive_empty_checks = 0
         
-        print(f"📋 Found {len(tasks)} task(s) available")
+        logger.info(f"📋 Found {len(tasks)} task(s) available")
         
         # ═══════════════════════════════════════════════════════════
         # FILTER AND CLAIM IMMEDIATELY - Speed is critical!
         # ═══════════════════════════════════════════════════════════
-        allowed_task_types = ['redditcommenttask','redditreplytask']
         claimable_tasks = []
-        rejected_tasks = []
+        rejected_tasks = []  # Full records for the first few rejections only (the details printout)
+        rejection_reasons = Counter()  # Main reason -> count, over every rejection
+        rejected_count = 0
+        
+        def reject(task, reason, content=None):
+            nonlocal rejected_count
+            rejected_count += 1
+            rejection_reasons[reason.partition('-')[0].strip()] += 1
+            if len(rejected_tasks) < MAX_REJECTION_DETAILS:
+                rejected_tasks.append({'task': task, 'reason': reason, 'content': content})
         
         for task in tasks:
-            task_type = task.get('type', '').lower()
-            task_name = task.get('name', '').lower()
-            task_title = task.get('title', '').lower()
-            task_id = task.get('_id') or task.get('id') or task.get('taskId', 'unknown')
+            # Exact type match first; otherwise search type, name and title in one pass
+            type_matches = task.get('type') in ALLOWED_TASK_TYPES or ALLOWED_TASK_TYPE_RE.search(
+                f"{task.get('type', '')}|{task.get('name', '')}|{task.get('title', '')}"
+            ) is not None
             
-            # Check if task type matches allowed types
-            type_matches = any(allowed_type in task_type or allowed_type in task_name or allowed_type in task_title 
-                   for allowed_type in allowed_task_types)
+            if not type_matches:
+                # Task type not allowed
+                reject(task, WRONG_TYPE_REASON)
+                continue
             
-            if type_matches:
-                # Check if task is targeting an NSFW subreddit first
-                is_nsfw, subreddit_name = self.is_nsfw_subreddit(task)
-                if is_nsfw:
-                    rejected_tasks.append({
-                        'task': task,
-                        'reason': f"NSFW subreddit - r/{subreddit_name}",
-                        'content': None
-                    })
-                    continue
-                
-                # Check task content for safety
-                content = task.get('content', '') or task.get('comment', '') or task.get('text', '') or task.get('body', '')
-                is_safe, reason = self.is_content_safe(content)
-                
-                if is_safe:
-                    claimable_tasks.append(task)
-                else:
-                    rejected_tasks.append({
-                        'task': task,
-                        'reason': f"Unsafe content - {reason}",
-                        'content': content
-                    })
+            # Check if task is targeting an NSFW subreddit first
+            is_nsfw, subreddit_name = self.is_nsfw_subreddit(task)
+            if is_nsfw:
+                reject(task, f"NSFW subreddit - r/{subreddit_name}")
+                continue
+            
+            # Check task content for safety
+            content = _first(task, 'content', 'comment', 'text', 'body') or ''
+            is_safe, reason = self.is_content_safe(content)
+            
+            if is_safe:
+                claimable_tasks.append(task)
             else:
-                # Task type not allowed
-                rejected_tasks.append({
-                    'task': task,
-                    'reason': f"Wrong type - only 'RedditCommentTask', 'RedditReplyToComment', and 'RedditReplyTask' allowed",
-                    'content': None
-                })
+                reject(task, f"Unsafe content - {reason}", content)
         
         # Quick summary
-        print(f"📊 Filtering: {len(tasks)} total → {len(claimable_tasks)} claimable, {len(rejected_tasks)} rejected")
+        logger.info(f"📊 Filtering: {len(tasks)} total → {len(claimable_tasks)} claimable, {rejected_count} rejected")
         
         # Show rejection details if any tasks were rejected
+        # (built up and written in one go, so it isn't interleaved with other threads' output)
         if rejected_tasks:
-            print(f"\n🚫 REJECTED TASKS DETAILS:")
-            for i, rejected in enumerate(rejected_tasks[:5], 1):  # Show max 5 rejections
+            lines = [f"\n🚫 REJECTED TASKS DETAILS:"]
+            for i, rejected in enumerate(rejected_tasks, 1):  # Only the first few are kept
                 task_id = rejected['task'].get('_id', 'unknown')
-                print(f"   {i}. Task {task_id[:8]}...")
-                print(f"      Reason: {rejected['reason']}")
+                lines.append(f"   {i}. Task {task_id[:8]}...")
+                lines.append(f"      Reason: {rejected['reason']}")
                 if rejected['content']:
                     # Show snippet of content
                     content_snippet = rejected['content'][:100]
                     if len(rejected['content']) > 100:
                         content_snippet += "..."
-                    print(f"      Content: {content_snippet}")
-            if len(rejected_tasks) > 5:
-                print(f"   ... and {len(rejected_tasks) - 5} more rejected tasks")
-            print()
+                    lines.append(f"      Content: {content_snippet}")
+            if rejected_count > len(rejected_tasks):
+                lines.append(f"   ... and {rejected_count - len(rejected_tasks)} more rejected tasks")
+            logger.info("\n".join(lines) + "\n")
         
         if not claimable_tasks:
-            print(f"⚠️ No safe claimable tasks found!")
+            logger.warning(f"⚠️ No safe claimable tasks found!")
             
             # Build detailed rejection summary for notification
-            rejection_reasons = {}
-            for rejected in rejected_tasks:
-                reason_key = rejected['reason'].split('-')[0].strip()  # Get main reason
-                rejection_reasons[reason_key] = rejection_reasons.get(reason_key, 0) + 1
-            
-            rejection_summary = "\n".join([f"• {reason}: {count}" for reason, count in rejection_reasons.items()])
+            rejection_summary = "\n".join(f"• {reason}: {count}" for reason, count in rejection_reasons.items())
             
             # Send single summary notification
             self.send_notification(
                 "No Claimable Tasks",
-                f"🔍 {len(tasks)} found\n🚫 All rejected\n\n{rejection_summary}\n\n⏱️ Retry in 3s",
+                f"🔍 {len(tasks)} found\n🚫 All rejected\n\n{rejection_summary}",
                 priority="low",
                 tags="mag"
             )
@@ -1710,36 +2280,47 @@ class TaskFluxBot:
         # ═══════════════════════════════════════════════════════════
         # CLAIM THE FIRST SAFE TASK IMMEDIATELY
         # Speed is CRITICAL - claim as fast as possible!
+        # If another worker beats us to it, fall through to the next
+        # safe task in this same check instead of waiting for a re-poll
         # ═══════════════════════════════════════════════════════════
-        print(f"🎯 CLAIMING FIRST SAFE TASK IMMEDIATELY...")
+        logger.info(f"🎯 CLAIMING FIRST SAFE TASK IMMEDIATELY...")
         
-        task = claimable_tasks[0]
-        task_id = task.get('_id') or task.get('id') or task.get('taskId')
-        
-        if not task_id:
-            print(f"❌ No task ID found!")
-            return False
+        # Best-paying, then newest first: fresh tasks are less likely to be gone already
+        claimable_tasks.sort(key=_claim_priority, reverse=True)
         
-        # Claim the task (speed is critical!)
-        claimed = self.claim_task(task_id, task_details=task)
+        claimed = False
+        for task in claimable_tasks[:MAX_CLAIM_ATTEMPTS]:
+            task_id = _first(task, '_id', 'id', 'taskId')
+            
+            if not task_id:
+                logger.warning(f"❌ No task ID found!")
+                continue
+            
+            # Claim the task (speed is critical!)
+            claimed = self.claim_task(task_id, task_details=task)
+            if claimed:
+                break
+            logger.warning(f"❌ Failed to claim task {task_id[:8]}...")
         
         if not claimed:
-            print(f"❌ Failed to claim task")
+            logger.warning(f"❌ Failed to claim task")
             return False
         
         # Task claimed successfully!
-        print(f"✅ Task claimed successfully!")
-        print(f"   Total tasks found: {len(tasks)}")
-        print(f"   Claimable: {len(claimable_tasks)}")
-        print(f"   Rejected: {len(rejected_tasks)}")
-        print(f"   Claimed: ✅ 1")
+        logger.info("\n".join((
+            f"✅ Task claimed successfully!",
+            f"   Total tasks found: {len(tasks)}",
+            f"   Claimable: {len(claimable_tasks)}",
+            f"   Rejected: {rejected_count}",
+            f"   Claimed: ✅ 1",
+        )))
         
         # Store current task ID to prevent double-claiming
         self.current_task_id = task_id
         self.current_task_type = task.get('type', 'N/A')
         
         # Send single summary notification AFTER claiming
-        summary_msg = f"🔍 {len(tasks)} found\n✅ {len(claimable_tasks)} safe\n🚫 {len(rejected_tasks)} rejected"
+        summary_msg = f"🔍 {len(tasks)} found\n✅ {len(claimable_tasks)} safe\n🚫 {rejected_count} rejected"
         
         self.send_notification(
             "Task Check Summary",
@@ -1755,33 +2336,44 @@ class TaskFluxBot:
         Main bot loop with proper flow:
         1. Login
         2. Check for assigned task → Monitor with deadline warnings
-        3. Check for cooldown → Sleep with notifications (10min, 5min)
+        3. Check for cooldown → Sleep with notifications (1h, 10min, 2min)
         4. Check and claim tasks → Send notifications
         5. Repeat
+        
+        check_interval: Seconds between the starts of consecutive task searches
         """
         # Initial login
         if not self.login():
-            print("❌ Failed to login. Exiting...")
+            logger.error("❌ Failed to login. Exiting...")
+            self.flush_notifications()
             return
         
+        # Pre-open the connections used by the concurrent polls and the claim
+        self.warm_connections()
+        
+        # `kill -USR1 <pid>` wakes the bot from any wait (not available on Windows)
+        if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, self.request_wake)
+        
         # Start command listener thread
         if self.ntfy_url:
             self.listener_thread = threading.Thread(target=self.listen_for_commands, daemon=True)
             self.listener_thread.start()
-            print("✅ Command listener thread started")
+            logger.info("✅ Command listener thread started")
+        else:
+            # Reported once here; send_notification only logs the skip at debug level
+            logger.warning("⚠️ No ntfy URL configured - notifications and commands are disabled")
         
         loop_count = 0
-        cooldown_1h_sent = False
-        cooldown_10min_sent = False
-        cooldown_5min_sent = False
-        cooldown_2min_sent = False
         
         try:
             while True:
                 try:
                     loop_count += 1
-                    ist = pytz.timezone('Asia/Kolkata')
-                    current_time = datetime.now(ist).strftime('%I:%M:%S %p IST')
+                    # One clock read per tick: wall clock for display, monotonic for deadline math
+                    now = self.get_ist_now()
+                    now_mono = time.monotonic()
+                    current_time = now.strftime('%I:%M:%S %p IST')
                     
                     # ═══════════════════════════════════════════════════════════
                     # STEP 0: Process any pending commands
@@ -1795,42 +2387,40 @@ class TaskFluxBot:
                     
                     if has_assigned_task:
                         # Task is assigned - monitor and send deadline warnings
-                        print(f"\n{'='*60}")
-                        print(f"📋 TASK MONITORING - Check #{loop_count} - {current_time}")
-                        print(f"{'='*60}")
-                        
                         # Get/update task details if not set
                         if not self.task_deadline:
-                            self.check_for_running_task(send_notification=(loop_count == 1))
+                            self.check_for_running_task(send_notification=(loop_count == 1), now_mono=now_mono)
                         
-                        # Check deadline and send warnings (2h, 30min)
+                        # Check for a missed deadline (2h / 30min warnings fire from timers)
                         if self.task_deadline:
-                            self.check_task_deadline()
-                            time_remaining = self.task_deadline - self.get_ist_now()
-                            hours_remaining = time_remaining.total_seconds() / 3600
-                            print(f"   ⏳ {hours_remaining:.1f}h until deadline")
+                            self.check_task_deadline(now_mono)
                         
-                        print(f"{'='*60}")
+                        # Banner built once the deadline is known and logged as one record,
+                        # so the checks' own output can't land inside it
+                        banner = [
+                            f"\n{'='*60}",
+                            f"📋 TASK MONITORING - Check #{loop_count} - {current_time}",
+                            f"{'='*60}",
+                        ]
+                        if self.task_deadline:
+                            hours_remaining = self.task_seconds_left(now_mono) / 3600
+                            banner.append(f"   ⏳ {hours_remaining:.1f}h until deadline")
+                            banner.append(f"{'='*60}")
+                        logger.info("\n".join(banner))
                         
                         # Check for task completion (every 2 minutes)
-                        print(f"🔍 Checking for task submission...")
+                        logger.info(f"🔍 Checking for task submission...")
                         task_completed = self.check_task_completion()
                         
                         if task_completed:
-                            # Task submitted! Cooldown started, reset flags
-                            cooldown_1h_sent = False
-                            cooldown_10min_sent = False
-                            cooldown_5min_sent = False
-                            cooldown_2min_sent = False
-                            time.sleep(3)
+                            # Task submitted! Cooldown synced and announced by check_task_completion
+                            self.sleep_interruptible(3)
                             continue
                         
                         # Task still active, check again in 2 minutes
-                        print(f"📋 Task in progress - checking again in 2 min...")
-                        # Break sleep into chunks to process commands
-                        for _ in range(12):  # 12 chunks of 10 seconds = 120 seconds
-                            time.sleep(10)
-                            self.process_commands()
+                        logger.info(f"📋 Task in progress - checking again in 2 min...")
+                        # Wait, handling commands as they arrive
+                        self.sleep_interruptible(120)
                         continue
                     
                     # ═══════════════════════════════════════════════════════════
@@ -1841,268 +2431,152 @@ class TaskFluxBot:
                         # We had a task - check if it was submitted
                         task_completed = self.check_task_completion()
                         if task_completed:
-                            # Task was submitted! Now sync cooldown and send cooldown notification
-                            print(f"🔄 Syncing cooldown from server...")
-                            self.sync_cooldown_from_server()
-                            
-                            # Send cooldown notification
-                            if self.cooldown_end:
-                                remaining = self.get_cooldown_remaining()
-                                hours = remaining.total_seconds() / 3600 if remaining else 0
-                                
-                                print(f"📤 Sending 'Cooldown Started' notification...")
-                                success = self.send_notification(
-                                    "Cooldown Started",
-                                    f"⌛ {hours:.1f}h\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
-                                    priority="default",
-                                    tags="hourglass",
-                                    delay_after=1.0
-                                )
-                                
-                                if not success:
-                                    print(f"⚠️ Failed to send 'Cooldown Started' notification, retrying after 3s...")
-                                    time.sleep(3)
-                                    self.send_notification(
-                                        "Cooldown Started",
-                                        f"⌛ {hours:.1f}h\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
-                                        priority="default",
-                                        tags="hourglass",
-                                        delay_after=1.0
-                                    )
-                            
-                            # Reset cooldown flags for new cooldown cycle
-                            cooldown_1h_sent = False
-                            cooldown_10min_sent = False
-                            cooldown_5min_sent = False
-                            cooldown_2min_sent = False
-                            time.sleep(3)
+                            # Task was submitted! Cooldown synced and announced by check_task_completion
+                            self.sleep_interruptible(3)
                             continue
                     
+                    # Reuses the can-assign response STEP 1 just fetched (poll cache), so this adds
+                    # no round-trip. It must stay after STEP 1: while a task is assigned the server
+                    # also reports canAssign=false + allowedAfter, which would be saved as a cooldown.
                     self.sync_cooldown_from_server()
                     
-                    if self.is_in_cooldown():
-                        remaining = self.get_cooldown_remaining()
-                        hours = remaining.total_seconds() / 3600
-                        minutes = remaining.total_seconds() / 60
+                    seconds_left = self.cooldown_seconds_left()
+                    if seconds_left:
+                        hours = seconds_left / 3600
+                        minutes = seconds_left / 60
+                        cooldown_end_str = self.cooldown_end.strftime('%I:%M %p IST')
                         
-                        print(f"\n{'='*60}")
-                        print(f"⏰ COOLDOWN - Check #{loop_count} - {current_time}")
-                        print(f"{'='*60}")
-                        print(f"   {hours:.1f}h until {self.cooldown_end.strftime('%I:%M %p IST')}")
-                        print(f"{'='*60}")
+                        logger.info("\n".join((
+                            f"\n{'='*60}",
+                            f"⏰ COOLDOWN - Check #{loop_count} - {current_time}",
+                            f"{'='*60}",
+                            f"   {hours:.1f}h until {cooldown_end_str}",
+                            f"{'='*60}",
+                        )))
                         
                         # Send notification on first check ONLY
                         if loop_count == 1:
                             self.send_notification(
                                 "Cooldown Active",
-                                f"⌛ {hours:.1f}h\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
+                                f"⌛ {hours:.1f}h\n🕐 {cooldown_end_str}",
                                 priority="default",
                                 tags="hourglass"
                             )
                             
                             # Send ONE accurate notification based on current remaining time
+                            # (later milestones are covered by the alert timers below)
                             if hours > 1:
                                 # More than 1 hour left - send "X Hours Left" notification
                                 self.send_notification(
                                     f"{hours:.1f}h Left",
-                                    f"⏰ {self.cooldown_end.strftime('%I:%M %p IST')}",
+                                    f"⏰ {cooldown_end_str}",
                                     priority="high",
                                     tags="alarm_clock"
                                 )
-                                cooldown_1h_sent = False  # Will send 1h notification later
                             elif minutes > 10:
                                 # Between 10-60 minutes - send exact minutes notification
                                 self.send_notification(
                                     f"{int(minutes)}min Left",
-                                    f"⏰ {self.cooldown_end.strftime('%I:%M %p IST')}",
+                                    f"⏰ {cooldown_end_str}",
                                     priority="high",
                                     tags="alarm_clock"
                                 )
-                                cooldown_1h_sent = True  # Skip 1h notification
-                                cooldown_10min_sent = False  # Will send 10min later
                             elif minutes > 2:
                                 # Between 2-10 minutes - send exact minutes notification
                                 self.send_notification(
                                     f"{int(minutes)}min Left",
-                                    f"⏰ {self.cooldown_end.strftime('%I:%M %p IST')}",
+                                    f"⏰ {cooldown_end_str}",
                                     priority="urgent",
                                     tags="alarm_clock"
                                 )
-                                cooldown_1h_sent = True
-                                cooldown_10min_sent = True
-                                cooldown_2min_sent = False  # Will send 2min later
                             else:
                                 # Less than 2 minutes - send final warning
                                 self.send_notification(
                                     "Cooldown Ending",
-                                    f"🔥 {int(minutes)}min\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
+                                    f"🔥 {int(minutes)}min\n🕐 {cooldown_end_str}",
                                     priority="urgent",
                                     tags="fire"
                                 )
-                                cooldown_1h_sent = True
-                                cooldown_10min_sent = True
-                                cooldown_2min_sent = True
                         
-                        # 1 hour warning (only if not already sent)
-                        if hours <= 1 and hours > 0.33 and not cooldown_1h_sent:
-                            cooldown_1h_sent = True
-                            self.send_notification(
-                                "1 Hour Left",
-                                f"⏰ {int(hours*60)}min\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
-                                priority="high",
-                                tags="alarm_clock"
-                            )
+                        # 1h / 10min / 2min alerts fire from timers, scheduled once per cooldown
+                        self.schedule_cooldown_alerts()
                         
-                        # 10 minute warning (only if not already sent)
-                        if minutes <= 10 and minutes > 5 and not cooldown_10min_sent:
-                            cooldown_10min_sent = True
-                            self.send_notification(
-                                "10 Minutes Left",
-                                f"⏰ {int(minutes)}min\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
-                                priority="high",
-                                tags="alarm_clock"
-                            )
-                        
-                        # 2 minute warning (final, only if not already sent)
-                        if minutes <= 2 and not cooldown_2min_sent:
-                            cooldown_2min_sent = True
-                            self.send_notification(
-                                "Cooldown Ending",
-                                f"🔥 {int(minutes)}min\n🕐 {self.cooldown_end.strftime('%I:%M %p IST')}",
-                                priority="urgent",
-                                tags="fire"
-                            )
-                        
-                        # Smart sleep - wake up before alerts
-                        if hours > 1.1:
-                            # More than 1h 6min left - sleep until 1h mark
-                            sleep_time = int((hours - 1.0) * 3600)
-                            print(f"💤 Sleeping {sleep_time//60}min until 1h mark...")
-                        elif minutes > 11:
-                            # Between 11min and 1h - sleep until 10min mark
-                            sleep_time = int((minutes - 10) * 60)
-                            print(f"💤 Sleeping {sleep_time//60}min until 10min mark...")
-                        elif minutes > 2.5:
-                            # Between 2.5-10min - sleep until 2min mark
-                            sleep_time = int((minutes - 2) * 60)
-                            print(f"💤 Sleeping {sleep_time//60}min until 2min mark...")
-                        else:
-                            # Less than 2.5min - sleep until end
-                            sleep_time = max(30, int(remaining.total_seconds()) + 5)
-                            print(f"💤 Sleeping {sleep_time}s until cooldown ends...")
-                        
-                        # Break long sleeps into 10-second chunks to process commands
-                        elapsed = 0
-                        while elapsed < sleep_time and not self.stop_listener:
-                            chunk = min(10, sleep_time - elapsed)
-                            time.sleep(chunk)
-                            elapsed += chunk
-                            # Process any commands that came in during sleep
-                            self.process_commands()
+                        # Sleep until the cooldown ends, plus a little jitter so we don't
+                        # hit the server at the exact same instant as other clients -
+                        # but never longer than MAX_COOLDOWN_SLEEP, so a cooldown cancelled
+                        # or shortened on the server is picked up within that time
+                        sleep_time = max(1.0, seconds_left) + random.uniform(1, COOLDOWN_WAKE_JITTER)
+                        if sleep_time > MAX_COOLDOWN_SLEEP:
+                            logger.info(f"💤 Sleeping {MAX_COOLDOWN_SLEEP//60}min, then re-checking cooldown...")
+                            # Wait, handling commands as they arrive
+                            self.sleep_interruptible(MAX_COOLDOWN_SLEEP)
+                            self.sync_cooldown_from_server(force=True)
+                            continue
                         
-                        # Reset flags when cooldown ends
-                        cooldown_1h_sent = False
-                        cooldown_10min_sent = False
-                        cooldown_5min_sent = False
-                        cooldown_2min_sent = False
+                        logger.info(f"💤 Sleeping {sleep_time//60:.0f}min until cooldown ends...")
+                        self.sleep_interruptible(sleep_time)
                         continue
                     
+                    # Cooldown over (or lifted early on the server) - drop any alerts still pending
+                    if self.cooldown_alert_timers:
+                        self.cancel_cooldown_alerts()
+                    
                     # ═══════════════════════════════════════════════════════════
                     # STEP 3: No task, no cooldown - check for new tasks
                     # ═══════════════════════════════════════════════════════════
                     
                     # Check if within claiming hours (8 AM - 11 PM IST)
                     if not self.is_within_claiming_hours():
-                        ist = pytz.timezone('Asia/Kolkata')
-                        now_ist = datetime.now(ist)
-                        
-                        # Calculate next 8 AM
-                        if now_ist.hour >= 23:
-                            next_8am = (now_ist + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
-                        else:
-                            next_8am = now_ist.replace(hour=8, minute=0, second=0, microsecond=0)
-                        
-                        time_until_8am = next_8am - now_ist
-                        sleep_seconds = int(time_until_8am.total_seconds()) + 60
-                        hours_until = sleep_seconds / 3600
-                        
-                        print(f"\n{'='*60}")
-                        print(f"😴 OUTSIDE CLAIMING HOURS - {current_time}")
-                        print(f"{'='*60}")
-                        print(f"   Claiming allowed: 8 AM - 11 PM IST")
-                        print(f"   Current time: {now_ist.strftime('%I:%M %p IST')}")
-                        print(f"   Sleeping {hours_until:.1f}h until 8 AM IST")
-                        print(f"   Resume at: {next_8am.strftime('%I:%M %p IST on %B %d')}")
-                        print(f"{'='*60}")
-                        
-                        # Send sleep notification on first sleep only
-                        if loop_count == 1 or not hasattr(self, '_off_hours_sleep_sent'):
-                            self._off_hours_sleep_sent = True
-                            self.send_notification(
-                                "Off-Hours Sleep",
-                                f"😴 {hours_until:.1f}h\n⏰ {next_8am.strftime('%I:%M %p IST')}\n🕐 Claiming: 8 AM - 11 PM",
-                                priority="default",
-                                tags="zzz"
-                            )
-                        
-                        # Break long sleep into 10-second chunks to process commands
-                        elapsed = 0
-                        while elapsed < sleep_seconds and not self.stop_listener:
-                            chunk = min(10, sleep_seconds - elapsed)
-                            time.sleep(chunk)
-                            elapsed += chunk
-                            # Process any commands that came in during sleep
-                            self.process_commands()
-                        
-                        # Reset flag and send wake notification
-                        self._off_hours_sleep_sent = False
-                        self.send_notification(
-                            "Bot Awake",
-                            f"☀️ Ready!\n🕐 {next_8am.strftime('%I:%M %p IST')}",
-                            priority="high",
-                            tags="sunny"
-                        )
+                        self.sleep_until_claiming_window(current_time)
                         continue
                     
-                    print(f"\n{'='*60}")
-                    print(f"🔍 TASK SEARCH - Check #{loop_count} - {current_time}")
-                    print(f"{'='*60}")
+                    logger.info("\n".join((
+                        f"\n{'='*60}",
+                        f"🔍 TASK SEARCH - Check #{loop_count} - {current_time}",
+                        f"{'='*60}",
+                    )))
                     
                     # Send ready notification on first check
                     if loop_count == 1:
-                        ist = pytz.timezone('Asia/Kolkata')
-                        current_ist = datetime.now(ist)
                         self.send_notification(
                             "Bot Ready",
-                            f"🟢 Searching\n🕐 {current_ist.strftime('%I:%M %p IST')}",
+                            f"🟢 Searching\n🕐 {now.strftime('%I:%M %p IST')}",
                             priority="high",
                             tags="green_circle"
                         )
                     
                     # Check and claim tasks (unless paused)
                     if self.is_paused:
-                        print(f"⏸️ Bot is paused - skipping task claiming")
-                        print(f"💤 Checking again in 10s...")
-                        time.sleep(10)
+                        logger.info(f"⏸️ Bot is paused - skipping task claiming")
+                        logger.info(f"💤 Checking again in 10s...")
+                        self.sleep_interruptible(10, wake_early=True)
                         continue
                     
-                    claimed = self.check_and_claim_tasks()
+                    claimed = self.check_and_claim_tasks(now_mono)
                     
                     if claimed:
                         # Task claimed! Switch to monitoring mode
-                        print(f"✅ Task claimed! Switching to monitoring...")
-                        time.sleep(3)
+                        # No pause needed: claim_task invalidated the poll cache, so the next
+                        # tick's assigned-task check fetches fresh state and starts monitoring
+                        logger.info(f"✅ Task claimed! Switching to monitoring...")
                         continue
                     
-                    # No task claimed - check again in 3 seconds
-                    print(f"💤 No task claimed - retrying in 3s...")
-                    time.sleep(3)
+                    # No task claimed - next check check_interval seconds after this one
+                    # started (monotonic, so the cadence neither drifts by the time the
+                    # check itself took nor jumps with wall-clock changes). A long run of
+                    # empty pools backs off exponentially so an idle bot polls less often.
+                    interval = check_interval
+                    backoff_steps = self.consecutive_empty_checks - EMPTY_CHECKS_BEFORE_BACKOFF + 1
+                    if backoff_steps > 0:
+                        interval = min(MAX_CHECK_INTERVAL, check_interval * 2 ** min(backoff_steps, 6))
+                    logger.info(f"💤 No task claimed - retrying in {interval}s...")
+                    self.sleep_interruptible(max(0.0, now_mono + interval - time.monotonic()), wake_early=True)
                     
                 except KeyboardInterrupt:
                     raise
                 except Exception as e:
-                    print(f"⚠️ Error in main loop: {e}")
-                    print(f"🔄 Retrying in 60s...")
+                    logger.warning(f"⚠️ Error in main loop: {e}")
+                    logger.info(f"🔄 Retrying in 60s...")
                     
                     # Send error notification
                     try:
@@ -2114,22 +2588,21 @@ class TaskFluxBot:
                             priority="high",
                             tags="warning"
                         )
-                    except:
+                    except Exception:
                         pass
                     
-                    time.sleep(60)
+                    self.sleep_interruptible(60)
                     
         except KeyboardInterrupt:
-            print(f"\n🛑 Bot stopped by user")
+            logger.info(f"\n🛑 Bot stopped by user")
             
             # Stop command listener thread
             self.stop_listener = True
             if self.listener_thread and self.listener_thread.is_alive():
-                print("⏳ Waiting for command listener to stop...")
+                logger.info("⏳ Waiting for command listener to stop...")
                 self.listener_thread.join(timeout=5)
             
-            ist = pytz.timezone('Asia/Kolkata')
-            current_ist = datetime.now(ist)
+            current_ist = datetime.now(IST)
             
             self.send_notification(
                 "Bot Stopped",
@@ -2137,9 +2610,10 @@ class TaskFluxBot:
                 priority="default",
                 tags="robot"
             )
+            self.flush_notifications()
         except Exception as e:
             # Critical crash - send urgent notification
-            print(f"\n💥 CRITICAL ERROR: {e}")
+            logger.error(f"\n💥 CRITICAL ERROR: {e}")
             import traceback
             traceback.print_exc()
             
@@ -2149,19 +2623,31 @@ class TaskFluxBot:
                 self.listener_thread.join(timeout=2)
             
             try:
-                ist = pytz.timezone('Asia/Kolkata')
-                current_ist = datetime.now(ist)
+                current_ist = datetime.now(IST)
                 self.send_notification(
                     "Bot Crashed",
                     f"💥 Critical Error\n⚠️ {str(e)[:100]}\n🕐 {current_ist.strftime('%I:%M %p IST')}",
                     priority="urgent",
                     tags="x"
                 )
-            except:
+                self.flush_notifications()
+            except Exception:
                 pass
 
 
 if __name__ == "__main__":
+    # The main loop and the per-tick checks it runs (task search, claiming, cooldown sync,
+    # completion/deadline checks) log through the "taskflux" logger, so
+    # TASKFLUX_LOG_LEVEL=WARNING keeps idle loops quiet; login, commands and notification
+    # delivery always print
+    log_level = getattr(logging, os.getenv("TASKFLUX_LOG_LEVEL", "INFO").upper(), logging.INFO)
+    logging.basicConfig(level=log_level, format="%(message)s", stream=sys.stdout)
+    
+    # Fail fast on missing credentials instead of after three failed logins
+    if not EMAIL or not PASSWORD:
+        logger.error("❌ EMAIL and PASSWORD must be set (in .env or the environment)")
+        sys.exit(1)
+    
     bot = TaskFluxBot()
     # Fixed check interval: 3 seconds
     bot.run(check_interval=3)
\ No newline at end of file